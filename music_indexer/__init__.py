@@ -9,6 +9,7 @@ from .core.metadata_extractor import MetadataExtractor
 from .core.cache_manager import CacheManager
 from .search.manual_search import ManualSearch
 from .search.auto_search import AutoSearch
+from .search.optimized_matcher import OptimizedMatcher
 from .search.string_matcher import StringMatcher
 from .utils.config_manager import ConfigManager
 from .utils.logger import get_logger
@@ -34,6 +35,9 @@ class MusicIndexer:
         self.manual_search = ManualSearch(self.cache_manager, self.string_matcher)
         self.auto_search = AutoSearch(self.cache_manager, self.string_matcher)
         self.smart_auto_selector = SmartAutoSelector()
+        self._optimized_matcher = None
+        self._optimized_matcher_suffixes = None
+        self._optimized_matcher_lock = threading.Lock()
         self.indexing_in_progress = False
         self.search_in_progress = False
         self.current_search_results = []
@@ -244,13 +248,16 @@ class MusicIndexer:
             self.search_in_progress = False
             return []
     
-    def process_match_file(self, file_path, show_progress=True):
+    def process_match_file(self, file_path, show_progress=True, not_found_cache=None, result_callback=None):
         """
         Process a match file and find matches for each entry.
         
         Args:
             file_path (str): Path to match file
             show_progress (bool): Whether to show progress bar
+            not_found_cache (NotFoundCache): Known misses to skip, updated with new ones (optional)
+            result_callback (function): Called with (result, processed, total) after each entry;
+                returning False stops processing (optional)
         
         Returns:
             list: List of results for each line
@@ -258,7 +265,9 @@ class MusicIndexer:
         self.search_in_progress = True
         
         try:
-            results = self.auto_search.process_match_file(file_path, show_progress)
+            results = self.auto_search.process_match_file(
+                file_path, show_progress, not_found_cache, result_callback
+            )
             self.search_in_progress = False
             return results
         
@@ -285,6 +294,21 @@ class MusicIndexer:
         thread.daemon = True
         thread.start()
     
+    def get_optimized_matcher(self):
+        """
+        Get the shared optimized matcher, recreated when the ignore suffixes change.
+        
+        Returns:
+            OptimizedMatcher: Matcher for enhanced automatic search
+        """
+        ignore_suffixes = list(self.config_manager.get("search", "ignore_suffixes", None) or [])
+        
+        with self._optimized_matcher_lock:
+            if self._optimized_matcher is None or self._optimized_matcher_suffixes != ignore_suffixes:
+                self._optimized_matcher = OptimizedMatcher(self.cache_manager, self.config_manager)
+                self._optimized_matcher_suffixes = ignore_suffixes
+            return self._optimized_matcher
+    
     def save_match_results(self, results, output_file):
         """
         Save match results to a file.
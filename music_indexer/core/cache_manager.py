@@ -578,6 +578,56 @@ class CacheManager:
                 'formats': {},
                 'avg_bitrate': 0
             }
+    
+    def get_distinct_values(self, field):
+        """
+        Get the distinct non-empty values of a metadata field.
+        
+        Args:
+            field (str): 'artist', 'title' or 'album'
+        
+        Returns:
+            list: Values sorted case-insensitively
+        """
+        if field not in ('artist', 'title', 'album'):
+            raise ValueError(f"Unsupported field: {field}")
+        
+        try:
+            conn = sqlite3.connect(self.cache_file)
+            cursor = conn.cursor()
+            cursor.execute(
+                f"SELECT DISTINCT {field} FROM files WHERE {field} IS NOT NULL AND {field} != '' "
+                f"ORDER BY {field} COLLATE NOCASE"
+            )
+            values = [row[0] for row in cursor.fetchall()]
+            conn.close()
+            return values
+        
+        except sqlite3.Error as e:
+            logger.error(f"Error getting distinct {field} values: {str(e)}")
+            return []
+    
+    def get_index_version(self):
+        """
+        Get a value that changes whenever the indexed files change.
+        
+        Inserts raise the highest row id, rescans and updates raise the latest
+        scan time, and removals change the file count.
+        
+        Returns:
+            list: [file count, highest row id, latest scan time], or None on error
+        """
+        try:
+            conn = sqlite3.connect(self.cache_file)
+            cursor = conn.cursor()
+            cursor.execute('SELECT COUNT(*), MAX(id), MAX(last_scanned) FROM files')
+            version = list(cursor.fetchone())
+            conn.close()
+            return version
+        
+        except sqlite3.Error as e:
+            logger.error(f"Error getting index version: {str(e)}")
+            return None
             
     def get_candidate_files(self, artist_words=None, title_words=None, limit=1000):
         """
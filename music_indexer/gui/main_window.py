@@ -285,6 +285,7 @@ class MainWindow(QMainWindow):
         
         if success:
             self.update_status()
+            self.search_panel.update_completions()
             QMessageBox.information(
                 self,
                 "Indexing Complete",
@@ -334,6 +335,7 @@ class MainWindow(QMainWindow):
         if reply == QMessageBox.Yes:
             if self.music_indexer.clear_cache():
                 self.update_status()
+                self.search_panel.update_completions()
                 QMessageBox.information(
                     self,
                     "Cache Cleared",
@@ -2,24 +2,227 @@
 Enhanced results panel GUI with streamlined view, resizable columns, sorting, and save/load functionality for the music indexer application.
 """
 import os
-import sys
-import subprocess
+import ctypes
 import json
+import csv
+import pickle
+import shutil
+import time
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QTreeWidget, QTreeWidgetItem, QHeaderView, QAbstractItemView,
     QFileDialog, QMessageBox, QProgressDialog, QCheckBox,
     QMenu, QStyle, QGroupBox, QButtonGroup, QComboBox,
-    QFrame, QSplitter
+    QFrame, QSplitter, QStyledItemDelegate
 )
-from PyQt5.QtCore import Qt, QSettings, QTimer, pyqtSignal
-from PyQt5.QtGui import QColor, QCursor, QIcon, QBrush, QFont
+from PyQt5.QtCore import (
+    Qt, QSettings, QTimer, QUrl, QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot,
+    QAbstractListModel, QModelIndex, QSignalBlocker
+)
+from PyQt5.QtGui import QColor, QCursor, QIcon, QBrush, QFont, QDesktopServices
 
 from ..utils.logger import get_logger
+from ..utils.app_paths import find_app_root_directory
+
+try:
+    import orjson
+except ImportError:  # Optional: faster result save/load, stdlib json otherwise
+    orjson = None
 
 logger = get_logger()
 
+# Write buffer for CSV/TXT exports (1 MB). Exports are not fsync'd on close;
+# they are ordinary user files and durability is left to the OS.
+EXPORT_BUFFER_SIZE = 1 << 20
+
+# Result sets with more entries than this are saved as compact JSON
+COMPACT_JSON_THRESHOLD = 500
+
+# Saved results files up to this size are kept decoded for a quick reload (8 MB)
+RESULTS_FILE_CACHE_LIMIT = 8 << 20
+
+# Threads used to check that saved selections still exist
+EXISTS_CHECK_WORKERS = 32
+
+# Result rows added to the tree per event loop pass
+DISPLAY_CHUNK_SIZE = 500
+
+# Minimum interval between copy worker progress signals (about 30 per second)
+PROGRESS_INTERVAL_NS = 33_000_000
+
+
+# Match score background brushes, highest threshold first
+_SCORE_BRUSHES = (
+    (90, QBrush(QColor(200, 255, 200))),
+    (80, QBrush(QColor(220, 255, 220))),
+    (70, QBrush(QColor(255, 255, 200))),
+)
+_LOW_SCORE_BRUSH = QBrush(QColor(255, 220, 220))
+
+# Foreground for the "No matches found" cell
+_NO_MATCH_BRUSH = QBrush(QColor(200, 0, 0))
+
+
+def _score_brush(score):
+    """Return the cached background brush for a match score."""
+    for threshold, brush in _SCORE_BRUSHES:
+        if score >= threshold:
+            return brush
+    return _LOW_SCORE_BRUSH
+
+
+def _format_duration(duration):
+    """Format a duration in seconds as m:ss."""
+    minutes, seconds = divmod(int(duration), 60)
+    return f"{minutes}:{seconds:02d}"
+
+
+def _write_json_file(file_path, data, compact=False):
+    """
+    Write data as JSON, using orjson when it is installed.
+    
+    Output is indented UTF-8 by default; compact output drops all
+    whitespace (and escapes non-ASCII with the stdlib encoder).
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS if compact else orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=option))
+    elif compact:
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=True, separators=(',', ':'))
+    else:
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def _read_json_file(file_path):
+    """Read a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        with open(file_path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+# The platform's file manager is picked once, at import
+if os.name == 'nt':
+    def _reveal_in_file_manager(file_path):
+        """Open Explorer with the file selected."""
+        # Explorer's /select needs ShellExecute; skip the cmd.exe shell
+        file_path = os.path.normpath(file_path)
+        ctypes.windll.shell32.ShellExecuteW(
+            None, 'open', 'explorer.exe', f'/select,"{file_path}"', None, 1
+        )
+else:
+    def _reveal_in_file_manager(file_path):
+        """Open the file's folder in the desktop's file manager (macOS and Linux)."""
+        folder_path = os.path.dirname(file_path)
+        if not QDesktopServices.openUrl(QUrl.fromLocalFile(folder_path)):
+            raise OSError(f"No application available to open {folder_path}")
+
+
+class CopyWorker(QRunnable):
+    """Worker for copying files to a destination folder using Qt's thread pool."""
+    
+    class Signals(QObject):
+        """Worker signals."""
+        progress = pyqtSignal(int, str)
+        finished = pyqtSignal(int, dict)
+    
+    def __init__(self, file_paths, destination):
+        """Initialize the worker."""
+        super().__init__()
+        self.file_paths = file_paths
+        self.destination = destination
+        # (source path, filename) pairs, so each path is only split once
+        self.copy_meta = [(path, os.path.basename(path)) for path in file_paths]
+        self.signals = self.Signals()
+        self.cancelled = False
+    
+    @pyqtSlot()
+    def run(self):
+        """Copy each file, reporting progress at most every PROGRESS_INTERVAL_NS."""
+        success_count = 0
+        failed_files = {}
+        destination = self.destination
+        join = os.path.join
+        normcase = os.path.normcase
+        
+        # Scan the destination once and resolve duplicate names against the
+        # set, instead of stat'ing every candidate name
+        try:
+            with os.scandir(destination) as entries:
+                used_names = {normcase(entry.name) for entry in entries}
+        except OSError:
+            used_names = set()  # The copies below will report the real error
+        total = len(self.copy_meta)
+        monotonic_ns = time.monotonic_ns
+        last_emit_ns = 0
+        
+        for index, (src_path, filename) in enumerate(self.copy_meta, 1):
+            if self.cancelled:
+                logger.info("File copy cancelled")
+                break
+            
+            try:
+                # Handle duplicate filenames
+                dest_name = filename
+                if normcase(dest_name) in used_names:
+                    base, ext = os.path.splitext(filename)
+                    counter = 1
+                    while normcase(dest_name) in used_names:
+                        dest_name = f"{base} ({counter}){ext}"
+                        counter += 1
+                used_names.add(normcase(dest_name))
+                dest_path = join(destination, dest_name)
+                
+                # Copy file contents; shutil uses the platform's in-kernel copy where available
+                shutil.copyfile(src_path, dest_path)
+                
+                success_count += 1
+            
+            except Exception as e:
+                logger.error(f"Failed to copy file {src_path}: {str(e)}")
+                failed_files[src_path] = str(e)
+            
+            now_ns = monotonic_ns()
+            if now_ns - last_emit_ns >= PROGRESS_INTERVAL_NS or index == total:
+                self.signals.progress.emit(index, filename)
+                last_emit_ns = now_ns
+        
+        self.signals.finished.emit(success_count, failed_files)
+
+
+class MatchListModel(QAbstractListModel):
+    """List model over a row's matches; display text is formatted on demand."""
+    
+    def __init__(self, matches, parent=None):
+        super().__init__(parent)
+        self.matches = matches  # Shared by reference, not copied
+    
+    def rowCount(self, parent=QModelIndex()):
+        """Return the number of matches."""
+        return 0 if parent.isValid() else len(self.matches)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """Return the display text or match dict for a match."""
+        if not index.isValid():
+            return None
+        match = self.matches[index.row()]
+        if role == Qt.DisplayRole:
+            filename = match.get('filename', 'Unknown')
+            score = match.get('combined_score', 0)
+            format_type = match.get('format', '').upper()
+            bitrate = match.get('bitrate', 0)
+            return f"{filename} ({score:.1f}% - {format_type} {bitrate}kbps)"
+        if role == Qt.UserRole:
+            return match
+        return None
+
 
 class MatchDropdown(QComboBox):
     """Custom dropdown widget for showing multiple matches for a single entry."""
@@ -42,19 +245,8 @@ class MatchDropdown(QComboBox):
             self.setEnabled(False)
             return
         
-        # Add matches to dropdown
-        for i, match in enumerate(self.matches):
-            filename = match.get('filename', 'Unknown')
-            score = match.get('combined_score', 0)
-            format_type = match.get('format', '').upper()
-            bitrate = match.get('bitrate', 0)
-            
-            # Create display text
-            display_text = f"{filename} ({score:.1f}% - {format_type} {bitrate}kbps)"
-            self.addItem(display_text)
-            
-            # Store the match data
-            self.setItemData(i, match, Qt.UserRole)
+        # Serve matches from a model over the list instead of copying each into the combo
+        self.setModel(MatchListModel(self.matches, self))
     
     def on_selection_changed(self, index):
         """Handle selection change."""
@@ -71,9 +263,71 @@ class MatchDropdown(QComboBox):
         return None
 
 
+class MatchDropdownDelegate(QStyledItemDelegate):
+    """
+    Item delegate for the Best Match column.
+    
+    A MatchDropdown is only created when the user opens a cell for editing,
+    instead of one combo box per multi-match row at load time.
+    """
+    
+    def __init__(self, panel):
+        super().__init__(panel.results_tree)
+        self.panel = panel
+    
+    def createEditor(self, parent, option, index):
+        """Create a dropdown for the row's matches."""
+        item = self.panel.results_tree.itemFromIndex(index)
+        matches = item.data(0, self.panel._PAYLOAD_ROLE)[2] if item else None
+        if not matches or len(matches) < 2:
+            return None
+        
+        dropdown = self.panel.create_match_dropdown(matches, item, parent)
+        # Picking an entry finishes the edit
+        dropdown.activated.connect(lambda: self.closeEditor.emit(dropdown))
+        QTimer.singleShot(0, dropdown.showPopup)
+        return dropdown
+    
+    def setEditorData(self, editor, index):
+        """Select the row's current match without re-emitting matchChanged."""
+        item = self.panel.results_tree.itemFromIndex(index)
+        file_path = item.data(0, self.panel._PAYLOAD_ROLE)[0]
+        for i, match in enumerate(editor.matches):
+            if match.get('file_path') == file_path:
+                editor.blockSignals(True)
+                editor.setCurrentIndex(i)
+                editor.blockSignals(False)
+                break
+    
+    def setModelData(self, editor, model, index):
+        """Nothing to write back; matchChanged already updated the item."""
+    
+    def updateEditorGeometry(self, editor, option, index):
+        """Fill the cell with the dropdown."""
+        editor.setGeometry(option.rect)
+
+
+class ScoreDelegate(QStyledItemDelegate):
+    """Item delegate for the Score column that colours the cell when it is painted."""
+    
+    def __init__(self, panel):
+        super().__init__(panel.results_tree)
+        self.payload_role = panel._PAYLOAD_ROLE
+    
+    def initStyleOption(self, option, index):
+        """Set the background from the row's current match score."""
+        super().initStyleOption(option, index)
+        payload = index.sibling(index.row(), 0).data(self.payload_role)
+        if payload and payload[1]:
+            option.backgroundBrush = _score_brush(payload[1].get('combined_score', 0))
+
+
 class StreamlinedResultsPanel(QWidget):
     """Streamlined results panel with dropdown matches, save/load functionality, and enhanced features."""
     
+    # Item data role on column 0 holding the row's (file path, current match dict, all matches)
+    _PAYLOAD_ROLE = Qt.UserRole + 1
+    
     def __init__(self, music_indexer):
         """Initialize the streamlined results panel."""
         super().__init__()
@@ -81,8 +335,15 @@ class StreamlinedResultsPanel(QWidget):
         self.music_indexer = music_indexer
         self.current_results = []
         self.grouped_results = {}
+        self.grouped_results_list = []  # grouped_results values in playlist line order
+        self._has_missing = None  # Cached has_missing_tracks() result, None = not computed
+        self._bulk_select_in_progress = False  # Suppresses per-item on_item_changed handling
+        self._display_generation = 0  # Bumped to cancel an in-progress chunked display
+        self._saved_sort = None  # (column, order) to restore once population finishes
+        self._results_file_cache = None  # ((path, mtime_ns, size), pickled data) of last loaded file
         self.auto_selected_files = set()  # Track auto-selected files
-        self.match_dropdowns = []  # Store dropdown references as list
+        self.is_auto_search = False  # Results came from auto search (grouped by playlist line)
+        self.is_enhanced_search = False  # Results came from the enhanced matcher
         
         # Set up UI
         self.init_ui()
@@ -99,19 +360,7 @@ class StreamlinedResultsPanel(QWidget):
         Returns:
             str: Path to app root directory
         """
-        # Get the directory where main.py is located
-        # Since we're in music_indexer/gui/results_panel_streamlined.py, we need to go up 2 levels
-        current_file = os.path.abspath(__file__)
-        app_root = os.path.dirname(os.path.dirname(os.path.dirname(current_file)))
-        
-        # Verify that main.py exists in this directory
-        main_py_path = os.path.join(app_root, "main.py")
-        if os.path.exists(main_py_path):
-            return app_root
-        else:
-            # Fallback to current working directory if main.py not found
-            logger.warning(f"main.py not found at {main_py_path}, using current working directory")
-            return os.getcwd()
+        return find_app_root_directory()
     
     def init_ui(self):
         """Initialize the user interface."""
@@ -155,9 +404,19 @@ class StreamlinedResultsPanel(QWidget):
         self.results_tree.setAlternatingRowColors(True)
         self.results_tree.setContextMenuPolicy(Qt.CustomContextMenu)
         self.results_tree.customContextMenuRequested.connect(self.show_context_menu)
+        self.create_context_menu()
         self.results_tree.itemDoubleClicked.connect(self.on_item_double_clicked)
         self.results_tree.itemChanged.connect(self.on_item_changed)
         
+        # Match dropdowns are created on demand by the Best Match delegate
+        self.results_tree.setUniformRowHeights(True)
+        self.results_tree.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.results_tree.setItemDelegateForColumn(3, MatchDropdownDelegate(self))
+        
+        # Score colours are applied at paint time, only for visible rows
+        self.results_tree.setItemDelegateForColumn(7, ScoreDelegate(self))
+        self.results_tree.itemClicked.connect(self.on_item_clicked)
+        
         # Enable sorting
         self.results_tree.setSortingEnabled(True)
         self.results_tree.sortByColumn(7, Qt.DescendingOrder)  # Sort by score descending
@@ -263,7 +522,7 @@ class StreamlinedResultsPanel(QWidget):
         
         # Generate default filename with timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        algorithm = "enhanced" if hasattr(self, 'is_enhanced_search') and getattr(self, 'is_enhanced_search', False) else "standard"
+        algorithm = "enhanced" if self.is_enhanced_search else "standard"
         default_filename = f"autosearch_results_{algorithm}_{timestamp}.json"
         default_path = os.path.join(default_dir, default_filename)
         
@@ -278,6 +537,11 @@ class StreamlinedResultsPanel(QWidget):
         if not file_path:
             return
         
+        try:
+            similarity_threshold = self.music_indexer.string_matcher.threshold
+        except AttributeError:
+            similarity_threshold = 75
+        
         try:
             # Prepare data for saving
             save_data = {
@@ -294,15 +558,14 @@ class StreamlinedResultsPanel(QWidget):
                 'grouped_results': self.grouped_results,
                 'auto_selected_files': list(self.auto_selected_files),
                 'search_settings': {
-                    'similarity_threshold': getattr(getattr(self.music_indexer, 'string_matcher', None), 'threshold', 75),
-                    'is_auto_search': getattr(self, 'is_auto_search', True),
+                    'similarity_threshold': similarity_threshold,
+                    'is_auto_search': self.is_auto_search,
                     'algorithm': algorithm
                 }
             }
             
-            # Save to file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(save_data, f, indent=2, ensure_ascii=False)
+            # Save to file; large result sets are written compact
+            _write_json_file(file_path, save_data, compact=len(self.grouped_results) > COMPACT_JSON_THRESHOLD)
             
             # Show success message
             file_size = os.path.getsize(file_path)
@@ -330,6 +593,30 @@ class StreamlinedResultsPanel(QWidget):
                 f"Failed to save auto search results:\n{str(e)}"
             )
     
+    def read_results_file(self, file_path):
+        """
+        Read a saved results file, reusing the last decoded copy if the file is unchanged.
+        
+        The copy is kept pickled so every load gets fresh objects; the loaded
+        grouped_results are modified in place when matches are changed. Only
+        files up to RESULTS_FILE_CACHE_LIMIT are kept, and only until another
+        file is loaded or the results are cleared.
+        """
+        stat = os.stat(file_path)
+        cache_key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+        
+        if self._results_file_cache and self._results_file_cache[0] == cache_key:
+            logger.debug(f"Using cached copy of results file: {file_path}")
+            return pickle.loads(self._results_file_cache[1])
+        
+        # Release the previous copy before decoding the next file
+        self._results_file_cache = None
+        
+        save_data = _read_json_file(file_path)
+        if stat.st_size <= RESULTS_FILE_CACHE_LIMIT:
+            self._results_file_cache = (cache_key, pickle.dumps(save_data, protocol=pickle.HIGHEST_PROTOCOL))
+        return save_data
+    
     def load_auto_search_results(self):
         """Load auto search results from a file."""
         # Get app root directory as default
@@ -356,8 +643,7 @@ class StreamlinedResultsPanel(QWidget):
         
         try:
             # Load data from file
-            with open(file_path, 'r', encoding='utf-8') as f:
-                save_data = json.load(f)
+            save_data = self.read_results_file(file_path)
             
             # Validate file format
             if 'grouped_results' not in save_data or 'metadata' not in save_data:
@@ -374,16 +660,24 @@ class StreamlinedResultsPanel(QWidget):
             auto_selected_files = set(save_data.get('auto_selected_files', []))
             search_settings = save_data.get('search_settings', {})
             
-            # Validate that files still exist
+            # Validate that files still exist; stat calls overlap, which matters on network drives
+            with ThreadPoolExecutor(max_workers=EXISTS_CHECK_WORKERS) as executor:
+                exists_flags = list(executor.map(os.path.exists, auto_selected_files))
+            
             missing_files = []
             valid_selected_files = set()
-            
-            for file_path_check in auto_selected_files:
-                if os.path.exists(file_path_check):
+            for file_path_check, exists in zip(auto_selected_files, exists_flags):
+                if exists:
                     valid_selected_files.add(file_path_check)
                 else:
                     missing_files.append(file_path_check)
             
+            # Logged too, since the confirmation that lists them can be turned off
+            if missing_files:
+                logger.warning(
+                    f"{len(missing_files)} previously selected files in {file_path} are no longer available"
+                )
+            
             # Show confirmation dialog with file info
             created_at = metadata.get('created_at', 'Unknown')
             algorithm = metadata.get('algorithm_used', 'Unknown')
@@ -392,38 +686,50 @@ class StreamlinedResultsPanel(QWidget):
             original_selected = metadata.get('selected_count', 0)
             current_valid = len(valid_selected_files)
             
-            confirm_text = f"📁 Load Auto Search Results\n\n"
-            confirm_text += f"📅 Created: {created_at}\n"
-            confirm_text += f"🔧 Algorithm: {algorithm.title()}\n"
-            confirm_text += f"📊 Entries: {total_entries}\n"
-            confirm_text += f"🎯 Total matches: {total_matches}\n"
-            confirm_text += f"✅ Originally selected: {original_selected}\n"
-            confirm_text += f"✅ Currently valid: {current_valid}\n"
-            
-            if missing_files:
-                confirm_text += f"⚠️ Missing files: {len(missing_files)}\n"
-            
-            confirm_text += f"\nLoad these results?"
-            
-            reply = QMessageBox.question(
-                self,
-                "Load Auto Search Results",
-                confirm_text,
-                QMessageBox.Yes | QMessageBox.No,
-                QMessageBox.Yes
-            )
-            
-            if reply != QMessageBox.Yes:
-                return
+            settings = QSettings("MusicIndexer", "MusicIndexer")
+            if not settings.value("load/skip_confirm", False, type=bool):
+                confirm_lines = [
+                    "📁 Load Auto Search Results",
+                    "",
+                    f"📅 Created: {created_at}",
+                    f"🔧 Algorithm: {algorithm.title()}",
+                    f"📊 Entries: {total_entries}",
+                    f"🎯 Total matches: {total_matches}",
+                    f"✅ Originally selected: {original_selected}",
+                    f"✅ Currently valid: {current_valid}",
+                ]
+                
+                if missing_files:
+                    confirm_lines.append(f"⚠️ Missing files: {len(missing_files)}")
+                
+                confirm_lines.extend(["", "Load these results?"])
+                
+                confirm_box = QMessageBox(
+                    QMessageBox.Question,
+                    "Load Auto Search Results",
+                    "\n".join(confirm_lines),
+                    QMessageBox.Yes | QMessageBox.No,
+                    self
+                )
+                confirm_box.setDefaultButton(QMessageBox.Yes)
+                # Keep a Python reference: setCheckBox does not take ownership in PyQt5
+                dont_ask_checkbox = QCheckBox("Don't ask again")
+                confirm_box.setCheckBox(dont_ask_checkbox)
+                
+                if confirm_box.exec_() != QMessageBox.Yes:
+                    return
+                
+                if dont_ask_checkbox.isChecked():
+                    settings.setValue("load/skip_confirm", True)
             
             # Load the results
             self.grouped_results = grouped_results
+            self.update_grouped_results_order()
+            self._has_missing = None
             self.auto_selected_files = valid_selected_files
             self.is_auto_search = search_settings.get('is_auto_search', True)
             
-            # Check if this was enhanced search
-            if algorithm == 'enhanced':
-                self.is_enhanced_search = True
+            self.is_enhanced_search = algorithm == 'enhanced'
             
             # Display the results
             self.display_streamlined_results()
@@ -464,10 +770,20 @@ class StreamlinedResultsPanel(QWidget):
         logger.debug(f"Header clicked: column {logical_index}")
         # Additional sorting logic if needed
     
+    def on_item_clicked(self, item, column):
+        """Open the match dropdown when a multi-match Best Match cell is clicked."""
+        if column == 3:
+            matches = item.data(0, self._PAYLOAD_ROLE)[2]
+            if matches and len(matches) > 1:
+                self.results_tree.editItem(item, 3)
+    
     def on_item_changed(self, item, column):
         """Handle item checkbox changes."""
+        if self._bulk_select_in_progress:
+            return
+        
         if column == 0:  # Checkbox column
-            file_path = item.data(0, Qt.UserRole + 1)
+            file_path = item.data(0, self._PAYLOAD_ROLE)[0]
             if file_path:
                 if item.checkState(0) == Qt.Checked:
                     self.auto_selected_files.add(file_path)
@@ -481,25 +797,27 @@ class StreamlinedResultsPanel(QWidget):
         if not new_match:
             return
 
-        # Update the displayed information in the tree item
-        self.update_tree_item_from_match(item, new_match)
+        # The item edits below must not come back through on_item_changed
+        with QSignalBlocker(self.results_tree):
+            # Update the displayed information in the tree item
+            self.update_tree_item_from_match(item, new_match)
 
-        # Update file path in user data
-        file_path = new_match.get('file_path', '')
-        old_file_path = item.data(0, Qt.UserRole + 1)
+            # Update file path in user data
+            file_path = new_match.get('file_path', '')
+            old_file_path, _, matches = item.data(0, self._PAYLOAD_ROLE)
 
-        if old_file_path != file_path:
-            # Remove old selection if it was selected
-            if old_file_path in self.auto_selected_files:
-                self.auto_selected_files.discard(old_file_path)
-                # Keep the item checked and update to new file path
-                if item.checkState(0) == Qt.Checked:
-                    self.auto_selected_files.add(file_path)
+            if old_file_path != file_path:
+                # Remove old selection if it was selected
+                if old_file_path in self.auto_selected_files:
+                    self.auto_selected_files.discard(old_file_path)
+                    # Keep the item checked and update to new file path
+                    if item.checkState(0) == Qt.Checked:
+                        self.auto_selected_files.add(file_path)
 
-            # Update stored file path
-            item.setData(0, Qt.UserRole + 1, file_path)
-            item.setData(0, Qt.UserRole + 2, new_match)  # Store full match data
+                # Update stored file path and match
+                item.setData(0, self._PAYLOAD_ROLE, (file_path, new_match, matches))
 
+        if old_file_path != file_path:
             # CRITICAL FIX: Update the grouped_results data structure
             # Find the corresponding entry in grouped_results and update it
             self.update_grouped_results_selection(item, new_match)
@@ -566,10 +884,7 @@ class StreamlinedResultsPanel(QWidget):
         item.setText(4, format_type.upper())  # Format
         
         # Duration
-        minutes = int(duration // 60)
-        seconds = int(duration % 60)
-        duration_text = f"{minutes}:{seconds:02d}"
-        item.setText(5, duration_text)
+        item.setText(5, _format_duration(duration))
         
         # Bitrate
         item.setText(6, f"{bitrate}")
@@ -577,27 +892,17 @@ class StreamlinedResultsPanel(QWidget):
         # Score
         item.setText(7, f"{score:.1f}%")
         
-        # Color code match score
-        if score >= 90:
-            item.setBackground(7, QColor(200, 255, 200))
-        elif score >= 80:
-            item.setBackground(7, QColor(220, 255, 220))
-        elif score >= 70:
-            item.setBackground(7, QColor(255, 255, 200))
-        else:
-            item.setBackground(7, QColor(255, 220, 220))
     
-    def create_match_dropdown(self, matches, tree_item):
-        """Create a match dropdown widget for a tree item."""
-        dropdown = MatchDropdown(matches)
+    def create_match_dropdown(self, matches, tree_item, parent=None):
+        """
+        Create a match dropdown widget for a tree item.
         
-        # Store reference to tree item in the dropdown for later lookup
-        dropdown.tree_item = tree_item
+        The dropdown is a delegate editor owned by the view and destroyed when
+        editing ends, so no reference to it is kept here.
+        """
+        dropdown = MatchDropdown(matches, parent)
         dropdown.matchChanged.connect(lambda match: self.on_match_dropdown_changed(tree_item, match))
         
-        # Add to our list of dropdowns
-        self.match_dropdowns.append(dropdown)
-        
         return dropdown
     
     def update_selection_summary(self):
@@ -628,13 +933,14 @@ class StreamlinedResultsPanel(QWidget):
         self.deselect_all_matches()
         
         auto_selected_count = 0
+        self.begin_bulk_selection()
         
         # Process each item in the tree
         for i in range(self.results_tree.topLevelItemCount()):
             item = self.results_tree.topLevelItem(i)
             
             # Check if item has matches
-            matches = item.data(0, Qt.UserRole + 3)  # Stored matches list
+            matches = item.data(0, self._PAYLOAD_ROLE)[2]  # Stored matches
             if not matches:
                 continue
             
@@ -643,45 +949,55 @@ class StreamlinedResultsPanel(QWidget):
             file_path = best_match.get('file_path', '')
             
             if file_path:
+                # Switch the row back to the best match if another one was picked
+                if item.data(0, self._PAYLOAD_ROLE)[0] != file_path:
+                    self.on_match_dropdown_changed(item, best_match)
+                
                 item.setCheckState(0, Qt.Checked)
                 self.auto_selected_files.add(file_path)
                 auto_selected_count += 1
-                
-                # Update dropdown to show selected match
-                dropdown_widget = self.results_tree.itemWidget(item, 3)  # Best Match column (now column 3)
-                if dropdown_widget and hasattr(dropdown_widget, 'setCurrentIndex'):
-                    dropdown_widget.setCurrentIndex(0)
         
-        self.update_selection_summary()
-        self.update_button_states()
+        self.end_bulk_selection()
         
         QMessageBox.information(self, "Auto-Selection Complete", 
                               f"Automatically selected {auto_selected_count} best matches.")
     
+    def begin_bulk_selection(self):
+        """Start changing many check boxes; itemChanged is not handled per item."""
+        self._bulk_select_in_progress = True
+        self.results_tree.blockSignals(True)
+    
+    def end_bulk_selection(self):
+        """Finish a bulk check box change and refresh the summary once."""
+        self.results_tree.blockSignals(False)
+        self._bulk_select_in_progress = False
+        self.update_selection_summary()
+        self.update_button_states()
+    
     def select_all_matches(self):
         """Select all available matches."""
         self.auto_selected_files.clear()
+        self.begin_bulk_selection()
         
         for i in range(self.results_tree.topLevelItemCount()):
             item = self.results_tree.topLevelItem(i)
-            file_path = item.data(0, Qt.UserRole + 1)
+            file_path = item.data(0, self._PAYLOAD_ROLE)[0]
             if file_path:
                 item.setCheckState(0, Qt.Checked)
                 self.auto_selected_files.add(file_path)
         
-        self.update_selection_summary()
-        self.update_button_states()
+        self.end_bulk_selection()
     
     def deselect_all_matches(self):
         """Deselect all matches."""
         self.auto_selected_files.clear()
+        self.begin_bulk_selection()
         
         for i in range(self.results_tree.topLevelItemCount()):
             item = self.results_tree.topLevelItem(i)
             item.setCheckState(0, Qt.Unchecked)
         
-        self.update_selection_summary()
-        self.update_button_states()
+        self.end_bulk_selection()
     
     def set_results(self, results):
         """Set search results."""
@@ -689,7 +1005,9 @@ class StreamlinedResultsPanel(QWidget):
         
         # Clear previous selections
         self.auto_selected_files.clear()
-        self.match_dropdowns.clear()
+        
+        # Fresh results carry no algorithm marker; only loaded files do
+        self.is_enhanced_search = False
         
         # Check if results are from auto_search (containing 'line' field)
         self.is_auto_search = any(
@@ -699,6 +1017,7 @@ class StreamlinedResultsPanel(QWidget):
         
         if self.is_auto_search:
             self.grouped_results = {}
+            self._has_missing = None
             # Group results by source line
             for result in results:
                 line = result.get('line', '')
@@ -714,108 +1033,73 @@ class StreamlinedResultsPanel(QWidget):
                     'matches': matches,
                     'line_num': result.get('line_num', 0)
                 }
+            self.update_grouped_results_order()
             
-            self.display_streamlined_results()
-            
-            # Auto-select best matches if enabled
+            # Auto-select best matches if enabled, once every row is displayed
             settings = QSettings("MusicIndexer", "MusicIndexer")
+            on_finished = None
             if settings.value("auto_select/enabled", True, type=bool):
                 # Small delay to ensure UI is ready
-                QTimer.singleShot(100, self.auto_select_best_matches)
+                on_finished = lambda: QTimer.singleShot(100, self.auto_select_best_matches)
+            
+            self.display_streamlined_results(on_finished)
         else:
             # Regular search results - convert to streamlined format
             self.display_flat_results()
     
-    def display_streamlined_results(self):
-        """Display streamlined search results in the tree."""
-        # Temporarily disable sorting to prevent issues during population
-        self.results_tree.setSortingEnabled(False)
+    def update_grouped_results_order(self):
+        """Order grouped results by line number once, when they are set."""
+        # Results usually arrive in line order already, which keeps the sort linear
+        self.grouped_results_list = sorted(
+            self.grouped_results.values(),
+            key=lambda group_data: group_data.get('line_num', 0)
+        )
+    
+    def display_streamlined_results(self, on_finished=None):
+        """
+        Display streamlined search results in the tree.
         
-        # Clear tree
+        Large result sets are added DISPLAY_CHUNK_SIZE rows per event loop
+        pass so the UI stays responsive; on_finished is called once every
+        row is in the tree.
+        """
+        # Detach sorting for the whole population
+        self.begin_tree_population()
+        
+        # Clear tree and abandon any population still in progress
         self.results_tree.clear()
-        self.match_dropdowns.clear()
+        self._display_generation += 1
         
         if not self.grouped_results:
+            self.end_tree_population()
             self.status_label.setText("No results to display")
             self.update_button_states()
             return
         
-        missing_count = 0
-        total_matches = 0
+        self.populate_streamlined_chunk(self._display_generation, self.grouped_results_list, 0, on_finished)
+    
+    def populate_streamlined_chunk(self, generation, groups, start, on_finished):
+        """Add the next chunk of grouped results to the tree."""
+        if generation != self._display_generation:
+            return  # Superseded by a newer display or clear
         
-        # Sort by line number
-        sorted_groups = sorted(
-            self.grouped_results.items(), 
-            key=lambda x: x[1].get('line_num', 0)
-        )
+        end = start + DISPLAY_CHUNK_SIZE
         
-        for key, group_data in sorted_groups:
-            line = group_data.get('line', '')
-            artist = group_data.get('artist', '')
-            title = group_data.get('title', '')
-            matches = group_data.get('matches', [])
-            match_count = len(matches)
-            
-            # Create tree item
-            item = QTreeWidgetItem(self.results_tree)
-            
-            # Add checkbox
-            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
-            item.setCheckState(0, Qt.Unchecked)
-            
-            # Set search entry text and track name from original text file
-            search_entry = line  # This is the full original line from text file
-            original_track_name = line  # Show the exact line from the text file
-            if artist and title:
-                search_entry = f"{artist} - {title}"
-            
-            # Set the columns in the new order
-            item.setText(1, original_track_name)  # Playlist Entry (2nd column)
-            item.setText(2, search_entry)  # Original Search (3rd column)
-            
-            if match_count == 0:
-                # No matches
-                item.setText(3, "❌ No matches found")
-                item.setForeground(3, QBrush(QColor(200, 0, 0)))
-                missing_count += 1
-                
-                # Store empty data
-                item.setData(0, Qt.UserRole + 1, "")  # No file path
-                item.setData(0, Qt.UserRole + 2, None)  # No match data
-                item.setData(0, Qt.UserRole + 3, [])  # No matches
-            else:
-                # Has matches - show best match by default
-                total_matches += match_count
-                best_match = matches[0]
-                
-                # Update tree item with best match info
-                self.update_tree_item_from_match(item, best_match)
-                
-                # Add search title to match data for display (use original line from text file)
-                enhanced_match = best_match.copy()
-                enhanced_match['search_title'] = line  # Use the exact original line from text file
-                enhanced_match['original_line'] = line  # Store original line as well
-                self.update_tree_item_from_match(item, enhanced_match)
-                
-                # Store match data
-                item.setData(0, Qt.UserRole + 1, best_match.get('file_path', ''))
-                item.setData(0, Qt.UserRole + 2, best_match)
-                item.setData(0, Qt.UserRole + 3, matches)  # Store all matches
-                
-                # Create dropdown for multiple matches
-                if match_count > 1:
-                    dropdown = self.create_match_dropdown(matches, item)
-                    self.results_tree.setItemWidget(item, 3, dropdown)  # Best Match column (now column 3)
-                    
-                    # Add indicator for multiple matches
-                    score_text = item.text(7)
-                    item.setText(7, f"{score_text} ({match_count} matches)")
+        # Build rows detached (no itemChanged, no per-row relayout), then insert at once
+        self.add_tree_items([self.create_group_item(group_data) for group_data in groups[start:end]])
         
-        # Re-enable sorting
-        self.results_tree.setSortingEnabled(True)
+        if end < len(groups):
+            self.status_label.setText(f"Loading results... {end} of {len(groups)}")
+            QTimer.singleShot(0, lambda: self.populate_streamlined_chunk(generation, groups, end, on_finished))
+            return
+        
+        # Sort once, now that every row is in
+        self.end_tree_population()
         
         # Update status
-        total_groups = len(self.grouped_results)
+        total_groups = len(groups)
+        missing_count = sum(1 for group_data in groups if not group_data.get('matches'))
+        total_matches = sum(len(group_data.get('matches', [])) for group_data in groups)
         found_groups = total_groups - missing_count
         
         self.status_label.setText(
@@ -825,36 +1109,145 @@ class StreamlinedResultsPanel(QWidget):
         )
         
         self.update_button_states()
+        
+        if on_finished:
+            on_finished()
+    
+    def create_group_item(self, group_data):
+        """Create a detached tree item for one grouped search entry."""
+        line = group_data.get('line', '')
+        artist = group_data.get('artist', '')
+        title = group_data.get('title', '')
+        matches = group_data.get('matches', [])
+        match_count = len(matches)
+        
+        item = QTreeWidgetItem()
+        
+        # Add checkbox
+        item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+        item.setCheckState(0, Qt.Unchecked)
+        
+        # Set search entry text and track name from original text file
+        search_entry = line  # This is the full original line from text file
+        original_track_name = line  # Show the exact line from the text file
+        if artist and title:
+            search_entry = f"{artist} - {title}"
+        
+        # Set the columns in the new order
+        item.setText(1, original_track_name)  # Playlist Entry (2nd column)
+        item.setText(2, search_entry)  # Original Search (3rd column)
+        
+        if match_count == 0:
+            # No matches
+            item.setText(3, "❌ No matches found")
+            item.setForeground(3, _NO_MATCH_BRUSH)
+            
+            # Store empty data
+            item.setData(0, self._PAYLOAD_ROLE, ("", None, ()))  # No file path, match or matches
+            return item
+        
+        # Has matches - show best match by default
+        best_match = matches[0]
+        
+        # Update tree item with best match info (columns 1-2 already hold the original line)
+        self.update_tree_item_from_match(item, best_match)
+        
+        # Store match data
+        file_path = best_match.get('file_path', '')
+        item.setData(0, self._PAYLOAD_ROLE, (file_path, best_match, tuple(matches)))
+        
+        # Restore the check box for selections carried over (e.g. from a loaded file)
+        if file_path in self.auto_selected_files:
+            item.setCheckState(0, Qt.Checked)
+        
+        # Multiple matches: the Best Match cell opens a dropdown when clicked
+        if match_count > 1:
+            item.setFlags(item.flags() | Qt.ItemIsEditable)
+            
+            # Add indicator for multiple matches
+            score_text = item.text(7)
+            item.setText(7, f"{score_text} ({match_count} matches)")
+        
+        return item
+    
+    def begin_tree_population(self):
+        """
+        Stop sorting while rows are added.
+        
+        The sort indicator is cleared as well as sorting being disabled, so
+        nothing re-sorts until end_tree_population restores it. Nested or
+        superseded populations keep the originally saved indicator.
+        """
+        tree = self.results_tree
+        if self._saved_sort is None:
+            header = tree.header()
+            self._saved_sort = (header.sortIndicatorSection(), header.sortIndicatorOrder())
+        tree.setSortingEnabled(False)
+        tree.header().setSortIndicator(-1, Qt.AscendingOrder)
+    
+    def end_tree_population(self):
+        """Re-enable sorting and sort once by the saved column."""
+        if self._saved_sort is None:
+            return
+        sort_column, sort_order = self._saved_sort
+        self._saved_sort = None
+        self.results_tree.setSortingEnabled(True)
+        self.results_tree.sortByColumn(sort_column, sort_order)
+    
+    def add_tree_items(self, items):
+        """
+        Insert top level items in one batch.
+        
+        Painting, tree signals and content-based column sizing are suspended
+        for the insert and restored afterwards, followed by a single repaint.
+        """
+        tree = self.results_tree
+        header = tree.header()
+        old_modes = [header.sectionResizeMode(i) for i in range(tree.columnCount())]
+        
+        tree.setUpdatesEnabled(False)
+        try:
+            with QSignalBlocker(tree):
+                for i in range(len(old_modes)):
+                    header.setSectionResizeMode(i, QHeaderView.Fixed)
+                tree.addTopLevelItems(items)
+        finally:
+            for i, mode in enumerate(old_modes):
+                header.setSectionResizeMode(i, mode)
+            tree.setUpdatesEnabled(True)
+            tree.viewport().update()
     
     def display_flat_results(self):
         """Display regular (non-grouped) search results in the tree."""
-        # Temporarily disable sorting
-        self.results_tree.setSortingEnabled(False)
+        # Detach sorting for the whole population
+        self.begin_tree_population()
         
-        # Clear tree
+        # Clear tree and abandon any chunked display in progress
         self.results_tree.clear()
-        self.match_dropdowns.clear()
+        self._display_generation += 1
         
         if not self.current_results:
+            self.end_tree_population()
             self.status_label.setText("No results to display")
             self.update_button_states()
             return
         
-        # Populate tree with flat results
+        # Populate tree with flat results, built detached and inserted once
+        items = []
+        
         for result in self.current_results:
             file_path = result.get('file_path', '')
             filename = os.path.basename(file_path)
             
-            item = QTreeWidgetItem(self.results_tree)
+            item = QTreeWidgetItem()
+            items.append(item)
             
             # Add checkbox
             item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
             item.setCheckState(0, Qt.Unchecked)
             
             # Store data
-            item.setData(0, Qt.UserRole + 1, file_path)
-            item.setData(0, Qt.UserRole + 2, result)
-            item.setData(0, Qt.UserRole + 3, [result])  # Single match
+            item.setData(0, self._PAYLOAD_ROLE, (file_path, result, (result,)))  # Single match
             
             # Set display data
             item.setText(1, "Manual Search")  # Playlist Entry (2nd column)
@@ -863,11 +1256,7 @@ class StreamlinedResultsPanel(QWidget):
             item.setText(4, result.get('format', '').upper())
             
             # Duration
-            duration = result.get('duration', 0)
-            minutes = int(duration // 60)
-            seconds = int(duration % 60)
-            duration_text = f"{minutes}:{seconds:02d}"
-            item.setText(5, duration_text)
+            item.setText(5, _format_duration(result.get('duration', 0)))
             
             # Bitrate
             bitrate = result.get('bitrate', 0)
@@ -876,19 +1265,11 @@ class StreamlinedResultsPanel(QWidget):
             # Match score
             score = result.get('combined_score', 0)
             item.setText(7, f"{score:.1f}%")
-            
-            # Color code match score
-            if score >= 90:
-                item.setBackground(7, QColor(200, 255, 200))
-            elif score >= 80:
-                item.setBackground(7, QColor(220, 255, 220))
-            elif score >= 70:
-                item.setBackground(7, QColor(255, 255, 200))
-            else:
-                item.setBackground(7, QColor(255, 220, 220))
         
-        # Re-enable sorting
-        self.results_tree.setSortingEnabled(True)
+        self.add_tree_items(items)
+        
+        # Sort once, now that every row is in
+        self.end_tree_population()
         
         # Update status
         self.status_label.setText(f"Displaying {len(self.current_results)} results")
@@ -899,7 +1280,7 @@ class StreamlinedResultsPanel(QWidget):
         has_results = self.results_tree.topLevelItemCount() > 0
         has_selections = len(self.auto_selected_files) > 0
         has_grouped_results = bool(self.grouped_results)
-        has_auto_search_results = has_grouped_results and getattr(self, 'is_auto_search', False)
+        has_auto_search_results = has_grouped_results and self.is_auto_search
         
         # Selection buttons
         self.auto_select_button.setEnabled(has_grouped_results)
@@ -975,60 +1356,35 @@ class StreamlinedResultsPanel(QWidget):
         self.copy_progress.setValue(0)
         self.copy_progress.show()
         
-        # Create timer for non-blocking copy
-        self.copy_timer = QTimer()
-        self.copy_index = 0
         self.file_paths_to_copy = file_paths
         self.destination_dir = destination
         self.copy_success_count = 0
         self.copy_failed_files = {}
         
-        self.copy_timer.timeout.connect(self.copy_next_file)
-        self.copy_timer.start(10)
+        # Copy on a pool thread so large files don't block the UI
+        self._copy_worker = CopyWorker(file_paths, destination)
+        self._copy_worker.signals.progress.connect(self.on_copy_progress, Qt.QueuedConnection)
+        self._copy_worker.signals.finished.connect(self.on_copy_finished)
+        self.copy_progress.canceled.connect(self.cancel_copy)
+        QThreadPool.globalInstance().start(self._copy_worker)
     
-    def copy_next_file(self):
-        """Copy the next file in the queue."""
-        if self.copy_index >= len(self.file_paths_to_copy):
-            self.copy_timer.stop()
-            self.copy_operation_completed()
-            return
-        
-        src_path = self.file_paths_to_copy[self.copy_index]
-        
-        try:
-            filename = os.path.basename(src_path)
-            dest_path = os.path.join(self.destination_dir, filename)
-            
-            # Update progress
-            self.copy_progress.setLabelText(f"Copying {self.copy_index + 1} of {len(self.file_paths_to_copy)}: {filename}")
-            
-            # Handle duplicate filenames
-            if os.path.exists(dest_path):
-                base, ext = os.path.splitext(filename)
-                counter = 1
-                while os.path.exists(dest_path):
-                    dest_path = os.path.join(self.destination_dir, f"{base} ({counter}){ext}")
-                    counter += 1
-            
-            # Copy file
-            with open(src_path, 'rb') as src_file:
-                with open(dest_path, 'wb') as dest_file:
-                    dest_file.write(src_file.read())
-            
-            self.copy_success_count += 1
-            
-        except Exception as e:
-            logger.error(f"Failed to copy file {src_path}: {str(e)}")
-            self.copy_failed_files[src_path] = str(e)
-        
-        # Update progress
-        self.copy_index += 1
-        self.copy_progress.setValue(self.copy_index)
-        
-        # Check if canceled
-        if self.copy_progress.wasCanceled():
-            self.copy_timer.stop()
-            self.copy_operation_completed()
+    def on_copy_progress(self, copied, filename):
+        """Update the copy progress dialog; the worker already throttles these signals."""
+        total_files = len(self.file_paths_to_copy)
+        self.copy_progress.setLabelText(f"Copying {copied} of {total_files}: {filename}")
+        self.copy_progress.setValue(copied)
+    
+    def cancel_copy(self):
+        """Ask the running copy worker to stop after the current file."""
+        if getattr(self, '_copy_worker', None):
+            self._copy_worker.cancelled = True
+    
+    def on_copy_finished(self, success_count, failed_files):
+        """Handle the copy worker finishing or being cancelled."""
+        self.copy_success_count = success_count
+        self.copy_failed_files = failed_files
+        self._copy_worker = None
+        self.copy_operation_completed()
     
     def copy_operation_completed(self):
         """Handle copy operation completion."""
@@ -1043,7 +1399,7 @@ class StreamlinedResultsPanel(QWidget):
             error_message = f"Successfully copied {self.copy_success_count} of {total_files} files.\n\n"
             error_message += f"{failed_count} files failed to copy:\n\n"
             
-            for path, error in list(self.copy_failed_files.items())[:5]:  # Show first 5 errors
+            for path, error in islice(self.copy_failed_files.items(), 5):  # Show first 5 errors
                 error_message += f"• {os.path.basename(path)}: {error}\n"
             
             if failed_count > 5:
@@ -1057,6 +1413,35 @@ class StreamlinedResultsPanel(QWidget):
                 f"Successfully copied all {self.copy_success_count} selected files to:\n{self.destination_dir}"
             )
     
+    def create_context_menu(self):
+        """Build the result context menu once; show_context_menu only updates it."""
+        self._ctx_item = None
+        self._ctx_file_path = None
+        self._ctx_menu = QMenu(self)
+        
+        # File-specific actions
+        self._ctx_show_action = self._ctx_menu.addAction("Show in Folder")
+        self._ctx_show_action.triggered.connect(self._ctx_show_in_folder)
+        self._ctx_play_action = self._ctx_menu.addAction("Play Audio")
+        self._ctx_play_action.triggered.connect(self._ctx_play)
+        self._ctx_select_action = self._ctx_menu.addAction("Select File")
+        self._ctx_select_action.triggered.connect(self._ctx_toggle_selection)
+        self._ctx_file_separator = self._ctx_menu.addSeparator()
+        
+        # General actions
+        self._ctx_menu.addAction("Export Results").triggered.connect(self.export_results)
+        self._ctx_export_missing_action = self._ctx_menu.addAction("Export Missing Tracks")
+        self._ctx_export_missing_action.triggered.connect(self.export_missing_tracks)
+        
+        # Save/load options for auto search results
+        self._ctx_save_separator = self._ctx_menu.addSeparator()
+        self._ctx_save_action = self._ctx_menu.addAction("Save Auto Search Results")
+        self._ctx_save_action.triggered.connect(self.save_auto_search_results)
+        self._ctx_load_action = self._ctx_menu.addAction("Load Auto Search Results")
+        self._ctx_load_action.triggered.connect(self.load_auto_search_results)
+        
+        self._ctx_menu.addAction("Clear Results").triggered.connect(self.clear_results)
+    
     def show_context_menu(self, position):
         """Show context menu when right-clicking on a result item."""
         if self.results_tree.topLevelItemCount() == 0:
@@ -1066,52 +1451,41 @@ class StreamlinedResultsPanel(QWidget):
         if not item:
             return
         
-        context_menu = QMenu(self)
-        
-        file_path = item.data(0, Qt.UserRole + 1)
+        file_path = item.data(0, self._PAYLOAD_ROLE)[0]
         has_file = bool(file_path)
+        self._ctx_item = item
+        self._ctx_file_path = file_path
         
+        for action in (self._ctx_show_action, self._ctx_play_action,
+                       self._ctx_select_action, self._ctx_file_separator):
+            action.setVisible(has_file)
         if has_file:
-            # File-specific actions
-            show_action = context_menu.addAction("Show in Folder")
-            play_action = context_menu.addAction("Play Audio")
-            
-            # Toggle selection action
-            if file_path in self.auto_selected_files:
-                select_action = context_menu.addAction("Unselect File")
-            else:
-                select_action = context_menu.addAction("Select File")
-            
-            context_menu.addSeparator()
-            
-            # Connect actions
-            show_action.triggered.connect(lambda: self.show_in_folder_single(file_path))
-            play_action.triggered.connect(lambda: self.play_audio_file(file_path))
-            select_action.triggered.connect(lambda: self.toggle_file_selection(item))
-        
-        # General actions
-        export_action = context_menu.addAction("Export Results")
-        export_action.triggered.connect(self.export_results)
-        
-        # Add missing tracks export for grouped results
-        if self.is_auto_search and self.has_missing_tracks():
-            export_missing_action = context_menu.addAction("Export Missing Tracks")
-            export_missing_action.triggered.connect(self.export_missing_tracks)
+            self._ctx_select_action.setText(
+                "Unselect File" if file_path in self.auto_selected_files else "Select File"
+            )
         
-        # Add save/load options to context menu
-        if self.grouped_results and getattr(self, 'is_auto_search', False):
-            context_menu.addSeparator()
-            
-            save_action = context_menu.addAction("Save Auto Search Results")
-            save_action.triggered.connect(self.save_auto_search_results)
-            
-            load_action = context_menu.addAction("Load Auto Search Results")  
-            load_action.triggered.connect(self.load_auto_search_results)
+        # Missing tracks export only applies to grouped results
+        self._ctx_export_missing_action.setVisible(
+            bool(self.is_auto_search) and self.has_missing_tracks()
+        )
         
-        clear_action = context_menu.addAction("Clear Results")
-        clear_action.triggered.connect(self.clear_results)
+        has_saved_results = bool(self.grouped_results) and self.is_auto_search
+        for action in (self._ctx_save_separator, self._ctx_save_action, self._ctx_load_action):
+            action.setVisible(has_saved_results)
         
-        context_menu.exec_(QCursor.pos())
+        self._ctx_menu.exec_(QCursor.pos())
+    
+    def _ctx_show_in_folder(self):
+        """Show the context menu's file in its folder."""
+        self.show_in_folder_single(self._ctx_file_path)
+    
+    def _ctx_play(self):
+        """Play the context menu's file."""
+        self.play_audio_file(self._ctx_file_path)
+    
+    def _ctx_toggle_selection(self):
+        """Toggle selection of the context menu's item."""
+        self.toggle_file_selection(self._ctx_item)
     
     def toggle_file_selection(self, item):
         """Toggle selection state of a file item."""
@@ -1138,15 +1512,7 @@ class StreamlinedResultsPanel(QWidget):
         logger.info(f"Showing file in folder: {file_path}")
         
         try:
-            if os.name == 'nt':  # Windows
-                file_path = os.path.normpath(file_path)
-                subprocess.run(['explorer', '/select,', file_path], shell=True)
-            elif os.name == 'posix':  # macOS and Linux
-                folder_path = os.path.dirname(file_path)
-                if sys.platform == 'darwin':  # macOS
-                    subprocess.run(['open', folder_path])
-                else:  # Linux
-                    subprocess.run(['xdg-open', folder_path])
+            _reveal_in_file_manager(file_path)
         except Exception as e:
             logger.error(f"Error showing file in folder: {str(e)}")
             QMessageBox.warning(self, "Error", f"Could not open folder: {str(e)}")
@@ -1164,34 +1530,33 @@ class StreamlinedResultsPanel(QWidget):
         logger.info(f"Playing audio file: {file_path}")
         
         try:
-            if os.name == 'nt':  # Windows
-                os.startfile(file_path)
-            elif os.name == 'posix':  # macOS and Linux
-                if sys.platform == 'darwin':  # macOS
-                    subprocess.run(['open', file_path])
-                else:  # Linux
-                    subprocess.run(['xdg-open', file_path])
+            if not QDesktopServices.openUrl(QUrl.fromLocalFile(file_path)):
+                raise OSError(f"No application available to open {file_path}")
         except Exception as e:
             logger.error(f"Error playing audio file: {str(e)}")
             QMessageBox.warning(self, "Error", f"Could not play file: {str(e)}")
     
     def on_item_double_clicked(self, item, column):
         """Handle double-click on an item."""
-        file_path = item.data(0, Qt.UserRole + 1)
+        file_path = item.data(0, self._PAYLOAD_ROLE)[0]
         if file_path:
             self.play_audio_file(file_path)
     
     def has_missing_tracks(self):
         """Check if there are any missing tracks in the grouped results."""
-        if not self.grouped_results:
-            return False
-        
-        for group_data in self.grouped_results.values():
-            matches = group_data.get('matches', [])
-            if len(matches) == 0:  # No matches = missing track
-                return True
-        
-        return False
+        if self._has_missing is None:
+            self._has_missing = any(
+                not group_data.get('matches') for group_data in self.grouped_results.values()
+            )
+        return self._has_missing
+    
+    def show_no_missing_tracks_message(self):
+        """Tell the user every playlist track was found."""
+        QMessageBox.information(
+            self,
+            "No Missing Tracks",
+            "Great news! All tracks from your playlist were found in your music collection."
+        )
     
     def export_missing_tracks(self):
         """Export tracks with no matches to a text file."""
@@ -1203,29 +1568,30 @@ class StreamlinedResultsPanel(QWidget):
             )
             return
         
-        # Collect missing tracks
+        # Cached check, so the common "everything matched" case skips collection and the dialog
+        if not self.has_missing_tracks():
+            self.show_no_missing_tracks_message()
+            return
+        
+        # Collect missing tracks in a single pass; the rows feed both the CSV and text formats
+        missing = [
+            (group_data.get('line', ''), group_data.get('artist', ''), group_data.get('title', ''))
+            for group_data in self.grouped_results.values()
+            if not group_data.get('matches')
+        ]
+        
         missing_tracks = []
-        for group_data in self.grouped_results.values():
-            matches = group_data.get('matches', [])
-            if len(matches) == 0:  # No matches found
-                line = group_data.get('line', '')
-                artist = group_data.get('artist', '')
-                title = group_data.get('title', '')
-                
-                # Use original line if available, otherwise reconstruct from artist/title
-                if line.strip():
-                    missing_tracks.append(line.strip())
-                elif artist and title:
-                    missing_tracks.append(f"{artist} - {title}")
-                elif title:  # Only title available
-                    missing_tracks.append(title)
+        for line, artist, title in missing:
+            # Use original line if available, otherwise reconstruct from artist/title
+            if line.strip():
+                missing_tracks.append(line.strip())
+            elif artist and title:
+                missing_tracks.append(f"{artist} - {title}")
+            elif title:  # Only title available
+                missing_tracks.append(title)
         
         if not missing_tracks:
-            QMessageBox.information(
-                self,
-                "No Missing Tracks",
-                "Great news! All tracks from your playlist were found in your music collection."
-            )
+            self.show_no_missing_tracks_message()
             return
         
         # Get default export directory
@@ -1253,31 +1619,21 @@ class StreamlinedResultsPanel(QWidget):
             # Determine format based on file extension
             file_ext = os.path.splitext(file_path)[1].lower()
             
-            with open(file_path, 'w', encoding='utf-8') as file:
+            with open(file_path, 'w', encoding='utf-8', newline='', buffering=EXPORT_BUFFER_SIZE) as file:
                 if file_ext == '.csv':
-                    # CSV format with headers
-                    file.write("Original Line,Artist,Title,Status\n")
-                    for group_data in self.grouped_results.values():
-                        matches = group_data.get('matches', [])
-                        if len(matches) == 0:
-                            line = group_data.get('line', '')
-                            artist = group_data.get('artist', '')
-                            title = group_data.get('title', '')
-                            
-                            # Escape CSV fields
-                            line_escaped = f'"{line.replace("\"", "\"\"")}"'
-                            artist_escaped = f'"{artist.replace("\"", "\"\"")}"'
-                            title_escaped = f'"{title.replace("\"", "\"\"")}"'
-                            
-                            file.write(f"{line_escaped},{artist_escaped},{title_escaped},Missing\n")
+                    # CSV format with headers; every field quoted, as in export_results
+                    writer = csv.writer(file, quoting=csv.QUOTE_ALL)
+                    writer.writerow(["Original Line", "Artist", "Title", "Status"])
+                    writer.writerows((line, artist, title, "Missing") for line, artist, title in missing)
                 else:
                     # Simple text format - ready for re-processing
-                    file.write("# Missing Tracks - Not found in your music collection\n")
-                    file.write("# You can use this file for automatic search after adding more music\n")
-                    file.write("# Format: Artist - Title (one per line)\n\n")
-                    
-                    for track in missing_tracks:
-                        file.write(f"{track}\n")
+                    file.write(
+                        "# Missing Tracks - Not found in your music collection\n"
+                        "# You can use this file for automatic search after adding more music\n"
+                        "# Format: Artist - Title (one per line)\n\n"
+                    )
+                    file.write("\n".join(missing_tracks))
+                    file.write("\n")
             
             # Show success message with statistics
             total_entries = len(self.grouped_results)
@@ -1329,44 +1685,43 @@ class StreamlinedResultsPanel(QWidget):
             return
         
         try:
-            with open(file_path, 'w', encoding='utf-8') as file:
-                if getattr(self, 'is_auto_search', False):
+            with open(file_path, 'w', encoding='utf-8', newline='', buffering=EXPORT_BUFFER_SIZE) as file:
+                # Every field quoted, as in the original hand-written export
+                writer = csv.writer(file, quoting=csv.QUOTE_ALL)
+                
+                # Snapshot the items and hoist lookups out of the row loop
+                tree = self.results_tree
+                items = [tree.topLevelItem(i) for i in range(tree.topLevelItemCount())]
+                selected_files = self.auto_selected_files
+                payload_role = self._PAYLOAD_ROLE
+                text_columns = range(1, 8)  # Playlist Entry .. Score
+                
+                if self.is_auto_search:
                     # Export streamlined results with selection status
-                    file.write("Selected,Playlist Entry,Original Search,Best Match Filename,Format,Duration,Bitrate,Match Score,Total Matches,File Path\n")
+                    writer.writerow([
+                        "Selected", "Playlist Entry", "Original Search", "Best Match Filename", "Format",
+                        "Duration", "Bitrate", "Match Score", "Total Matches", "File Path"
+                    ])
                     
-                    for i in range(self.results_tree.topLevelItemCount()):
-                        item = self.results_tree.topLevelItem(i)
-                        playlist_entry = item.text(1)
-                        original_search = item.text(2)
-                        best_match_filename = item.text(3)
-                        format_type = item.text(4)
-                        duration = item.text(5)
-                        bitrate = item.text(6)
-                        score = item.text(7)
-                        file_path_item = item.data(0, Qt.UserRole + 1)
-                        matches = item.data(0, Qt.UserRole + 3) or []
-                        
-                        selected = "Yes" if file_path_item in self.auto_selected_files else "No"
-                        
-                        file.write(f'"{selected}","{playlist_entry}","{original_search}","{best_match_filename}","{format_type}","{duration}","{bitrate}","{score}",{len(matches)},"{file_path_item}"\n')
+                    def rows():
+                        for item in items:
+                            file_path_item, _, matches = item.data(0, payload_role)
+                            selected = "Yes" if file_path_item in selected_files else "No"
+                            yield (selected, *map(item.text, text_columns), len(matches), file_path_item)
                 else:
                     # Export flat results
-                    file.write("Selected,Playlist Entry,Original Search,Filename,Format,Duration,Bitrate,Match Score,File Path\n")
+                    writer.writerow([
+                        "Selected", "Playlist Entry", "Original Search", "Filename", "Format",
+                        "Duration", "Bitrate", "Match Score", "File Path"
+                    ])
                     
-                    for i in range(self.results_tree.topLevelItemCount()):
-                        item = self.results_tree.topLevelItem(i)
-                        playlist_entry = item.text(1)
-                        original_search = item.text(2)
-                        filename = item.text(3)
-                        format_type = item.text(4)
-                        duration = item.text(5)
-                        bitrate = item.text(6)
-                        score = item.text(7)
-                        file_path_item = item.data(0, Qt.UserRole + 1)
-                        
-                        selected = "Yes" if file_path_item in self.auto_selected_files else "No"
-                        
-                        file.write(f'"{selected}","{playlist_entry}","{original_search}","{filename}","{format_type}","{duration}","{bitrate}","{score}","{file_path_item}"\n')
+                    def rows():
+                        for item in items:
+                            file_path_item = item.data(0, payload_role)[0]
+                            selected = "Yes" if file_path_item in selected_files else "No"
+                            yield (selected, *map(item.text, text_columns), file_path_item)
+                
+                writer.writerows(rows())
             
             QMessageBox.information(
                 self,
@@ -1386,9 +1741,13 @@ class StreamlinedResultsPanel(QWidget):
         """Clear search results."""
         self.current_results = []
         self.grouped_results = {}
+        self.grouped_results_list = []
+        self._has_missing = None
+        self._results_file_cache = None
         self.auto_selected_files.clear()
-        self.match_dropdowns.clear()
         self.results_tree.clear()
+        self._display_generation += 1
+        self.end_tree_population()  # A cancelled chunked display would leave sorting off
         self.status_label.setText("No results to display")
         self.update_selection_summary()
         self.update_button_states()
@@ -1396,32 +1755,42 @@ class StreamlinedResultsPanel(QWidget):
     def load_settings(self):
         """Load panel settings."""
         settings = QSettings("MusicIndexer", "MusicIndexer")
+        settings.beginGroup("results")
         
         # Load column widths
         for i in range(8):  # 8 columns now
-            width = settings.value(f"results/column_width_{i}", 0, type=int)
+            width = settings.value(f"column_width_{i}", 0, type=int)
             if width > 0:
                 self.results_tree.setColumnWidth(i, width)
         
         # Load sort column and order
-        sort_column = settings.value("results/sort_column", 7, type=int)  # Default to score column
-        sort_order = settings.value("results/sort_order", Qt.DescendingOrder, type=int)
+        sort_column = settings.value("sort_column", 7, type=int)  # Default to score column
+        sort_order = settings.value("sort_order", Qt.DescendingOrder, type=int)
+        settings.endGroup()
         self.results_tree.sortByColumn(sort_column, sort_order)
     
     def save_settings(self):
         """Save panel settings."""
         settings = QSettings("MusicIndexer", "MusicIndexer")
+        settings.beginGroup("results")
         
         # Save column widths
         for i in range(8):  # 8 columns now
-            settings.setValue(f"results/column_width_{i}", self.results_tree.columnWidth(i))
+            settings.setValue(f"column_width_{i}", self.results_tree.columnWidth(i))
         
-        # Save sort settings
-        header = self.results_tree.header()
-        sort_column = header.sortIndicatorSection()
-        sort_order = header.sortIndicatorOrder()
-        settings.setValue("results/sort_column", sort_column)
-        settings.setValue("results/sort_order", sort_order)
+        # Save sort settings; mid-population the indicator is cleared, so use the saved one
+        if self._saved_sort is not None:
+            sort_column, sort_order = self._saved_sort
+        else:
+            header = self.results_tree.header()
+            sort_column = header.sortIndicatorSection()
+            sort_order = header.sortIndicatorOrder()
+        settings.setValue("sort_column", sort_column)
+        settings.setValue("sort_order", sort_order)
+        settings.endGroup()
+        
+        # Flush all values in one write
+        settings.sync()
     
     def closeEvent(self, event):
         """Handle panel close event."""
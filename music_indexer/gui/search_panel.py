@@ -3,19 +3,192 @@ Enhanced search panel GUI with optimized matcher option for the music indexer ap
 Updated to use app root as default directory for browse buttons.
 """
 import os
+import time
 import logging
+from collections import OrderedDict
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit,
     QPushButton, QGroupBox, QRadioButton, QFileDialog,
     QComboBox, QSlider, QCheckBox, QMessageBox, QProgressDialog,
-    QFrame, QButtonGroup
+    QFrame, QButtonGroup, QCompleter
+)
+from PyQt5.QtCore import (
+    Qt, pyqtSignal, pyqtSlot, QSettings, QObject, QRunnable, QThreadPool, QTimer, QSignalBlocker,
+    QStringListModel
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QSettings
 
 from ..utils.logger import get_logger
+from ..utils.app_paths import find_app_root_directory
 logger = get_logger()
 
 from .log_console import LogConsole
+from ..search.match_result_cache import MatchResultCache
+from ..search.not_found_cache import NotFoundCache
+
+# Minimum interval between auto search progress signals (10 per second)
+PROGRESS_INTERVAL_NS = 100_000_000
+
+# Manual searches remembered for instant repeats; the least recently used are dropped first
+MAX_CACHED_SEARCHES = 32
+
+
+class SearchWorker(QRunnable):
+    """Worker that runs a search callable in a separate thread."""
+    
+    class Signals(QObject):
+        """Worker signals."""
+        finished = pyqtSignal(list)
+    
+    def __init__(self, search):
+        """Initialize the worker with a callable returning a result list."""
+        super().__init__()
+        self.search = search
+        self.signals = self.Signals()
+    
+    @pyqtSlot()
+    def run(self):
+        """Run the search and emit its results."""
+        try:
+            results = self.search()
+        except Exception as e:
+            logger.error(f"Error in search worker: {str(e)}")
+            results = []
+        
+        self.signals.finished.emit(results)
+
+
+class AutoSearchWorker(QRunnable):
+    """Worker for automatic search in a separate thread."""
+    
+    class Signals(QObject):
+        """Worker signals."""
+        search_progress = pyqtSignal(int, int, int)  # processed, total, matched
+        finished = pyqtSignal(list, dict)
+        
+    def __init__(self, music_indexer, match_file, use_enhanced, result_cache=None, cache_settings=None):
+        """Initialize the worker."""
+        super().__init__()
+        self.music_indexer = music_indexer
+        self.match_file = match_file
+        self.use_enhanced = use_enhanced
+        self.result_cache = result_cache
+        self.cache_settings = cache_settings
+        self.signals = self.Signals()
+        self.cancelled = False
+        self._progress = None
+        self._matched = 0
+        self._last_emit_ns = 0
+    
+    def _count_result(self, result, processed, total):
+        """
+        Count a finished entry, reporting progress at most every
+        PROGRESS_INTERVAL_NS. Returns False once the search has been cancelled.
+        """
+        if result.get('matches'):
+            self._matched += 1
+        self._progress = (processed, total)
+        
+        now_ns = time.monotonic_ns()
+        if now_ns - self._last_emit_ns >= PROGRESS_INTERVAL_NS:
+            self._emit_progress()
+            self._last_emit_ns = now_ns
+        
+        return not self.cancelled
+    
+    def _emit_progress(self):
+        """Report the entries counted since the last progress signal."""
+        if self._progress is not None:
+            processed, total = self._progress
+            self.signals.search_progress.emit(processed, total, self._matched)
+            self._progress = None
+    
+    def _summarize(self, results):
+        """
+        Count matches in one pass so the GUI thread only formats the summary;
+        match quality only applies to the enhanced algorithm.
+        """
+        summary = {
+            'total_matches': 0,
+            'missing_entries': 0,
+            'perfect_matches': 0,
+            'high_quality_matches': 0
+        }
+        
+        for result in results:
+            matches = result.get('matches') or ()
+            summary['total_matches'] += len(matches)
+            
+            if not matches:
+                summary['missing_entries'] += 1
+            elif self.use_enhanced:
+                best_match = matches[0]
+                if 'perfect_remix_match' in best_match.get('strategy', ''):
+                    summary['perfect_matches'] += 1
+                elif best_match.get('match_score', 0) >= 90:
+                    summary['high_quality_matches'] += 1
+        
+        return summary
+    
+    @pyqtSlot()
+    def run(self):
+        """Run the worker, reusing cached results for an unchanged file and index."""
+        try:
+            cache_key = None
+            if self.result_cache is not None:
+                cache_key = self.result_cache.make_key(self.match_file, self.cache_settings)
+            
+            results = self.result_cache.get(cache_key) if cache_key else None
+            if results is not None:
+                self.signals.finished.emit(results, self._summarize(results))
+                return
+            
+            # Entries that found nothing against this index before are skipped
+            not_found_cache = None
+            if self.result_cache is not None:
+                index_version = self.music_indexer.cache_manager.get_index_version()
+                if index_version is not None:
+                    not_found_cache = NotFoundCache(self.result_cache.cache_dir)
+                    not_found_cache.load(self.cache_settings, index_version)
+            
+            if self.use_enhanced:
+                # Use optimized matcher
+                matcher = self.music_indexer.get_optimized_matcher()
+                results = matcher.process_match_file(
+                    self.match_file,
+                    show_progress=False,
+                    not_found_cache=not_found_cache,
+                    result_callback=self._count_result
+                )
+            else:
+                # Use standard auto search
+                results = self.music_indexer.process_match_file(
+                    self.match_file, 
+                    show_progress=False,
+                    not_found_cache=not_found_cache,
+                    result_callback=self._count_result
+                )
+            
+            self._emit_progress()
+            
+            # Misses found before a cancel still hold; partial results are not cached
+            if not_found_cache is not None:
+                not_found_cache.save()
+            
+            if self.cancelled:
+                logger.info(f"Automatic search cancelled after {len(results)} entries")
+            elif results and cache_key:
+                self.result_cache.put(cache_key, results)
+            
+            # Emit finished signal with results
+            summary = self._summarize(results)
+            summary['cancelled'] = self.cancelled
+            self.signals.finished.emit(results, summary)
+        
+        except Exception as e:
+            logger.error(f"Error in auto search worker: {str(e)}")
+            import traceback
+            logger.error(traceback.format_exc())
+            self.signals.finished.emit([], {})
 
 
 class SearchPanel(QWidget):
@@ -24,11 +197,27 @@ class SearchPanel(QWidget):
     # Custom signals
     search_completed = pyqtSignal(list)
     
+    # Shared QSettings handle, created on first use
+    _settings = None
+    
     def __init__(self, music_indexer):
         """Initialize the enhanced search panel."""
         super().__init__()
         
         self.music_indexer = music_indexer
+        self._manual_search_worker = None  # Running manual search, kept alive until it reports back
+        self._manual_search_key = None  # Cache key of the running manual search
+        self._search_cache = OrderedDict()  # Recent manual search results by parameters and index version
+        self.auto_progress = None  # Progress dialog reused by every automatic search
+        self._auto_worker = None  # Running automatic search, cancelled from the progress dialog
+        self.match_result_cache = MatchResultCache(music_indexer.cache_manager)
+        self.not_found_cache = NotFoundCache(self.match_result_cache.cache_dir)
+        
+        # Apply the threshold once the slider has settled instead of on every tick
+        self._threshold_timer = QTimer(self)
+        self._threshold_timer.setSingleShot(True)
+        self._threshold_timer.setInterval(150)
+        self._threshold_timer.timeout.connect(self._apply_threshold)
         
         # Set up UI
         self.init_ui()
@@ -36,8 +225,18 @@ class SearchPanel(QWidget):
         # Load settings
         self.load_settings()
         
+        # Offer indexed artists and titles as the user types
+        self.update_completions()
+        
         logger.info("Enhanced search panel with optimized matcher initialized")
     
+    @classmethod
+    def _get_settings(cls):
+        """Get the shared QSettings instance."""
+        if cls._settings is None:
+            cls._settings = QSettings("MusicIndexer", "MusicIndexer")
+        return cls._settings
+    
     def get_app_root_directory(self):
         """
         Get the app root directory (where main.py is located).
@@ -45,19 +244,7 @@ class SearchPanel(QWidget):
         Returns:
             str: Path to app root directory
         """
-        # Get the directory where main.py is located
-        # Since we're in music_indexer/gui/search_panel.py, we need to go up 2 levels
-        current_file = os.path.abspath(__file__)
-        app_root = os.path.dirname(os.path.dirname(os.path.dirname(current_file)))
-        
-        # Verify that main.py exists in this directory
-        main_py_path = os.path.join(app_root, "main.py")
-        if os.path.exists(main_py_path):
-            return app_root
-        else:
-            # Fallback to current working directory if main.py not found
-            logger.warning(f"main.py not found at {main_py_path}, using current working directory")
-            return os.getcwd()
+        return find_app_root_directory()
     
     def init_ui(self):
         """Initialize the user interface."""
@@ -109,6 +296,8 @@ class SearchPanel(QWidget):
         artist_layout = QHBoxLayout()
         artist_layout.addWidget(QLabel("Artist:"))
         self.artist_input = QLineEdit()
+        self.artist_completer = self._create_completer()
+        self.artist_input.setCompleter(self.artist_completer)
         artist_layout.addWidget(self.artist_input)
         form_layout.addLayout(artist_layout)
         
@@ -116,6 +305,8 @@ class SearchPanel(QWidget):
         title_layout = QHBoxLayout()
         title_layout.addWidget(QLabel("Title:"))
         self.title_input = QLineEdit()
+        self.title_completer = self._create_completer()
+        self.title_input.setCompleter(self.title_completer)
         title_layout.addWidget(self.title_input)
         form_layout.addLayout(title_layout)
         
@@ -171,7 +362,8 @@ class SearchPanel(QWidget):
         
         # Similarity threshold (only for standard auto search)
         self.threshold_layout = QHBoxLayout()
-        self.threshold_layout.addWidget(QLabel("Similarity Threshold:"))
+        threshold_caption = QLabel("Similarity Threshold:")
+        self.threshold_layout.addWidget(threshold_caption)
         
         self.threshold_slider = QSlider(Qt.Horizontal)
         self.threshold_slider.setRange(0, 100)
@@ -184,6 +376,9 @@ class SearchPanel(QWidget):
         self.threshold_slider.valueChanged.connect(self._update_threshold_label)
         self.threshold_layout.addWidget(self.threshold_label)
         
+        # Shown and hidden together with the standard algorithm
+        self.threshold_widgets = (threshold_caption, self.threshold_slider, self.threshold_label)
+        
         auto_search_layout.addLayout(self.threshold_layout)
         
         # Search algorithm info
@@ -194,8 +389,14 @@ class SearchPanel(QWidget):
         
         # Process button
         process_button_layout = QHBoxLayout()
+        self.clear_cached_results_button = QPushButton("Clear Cached Results")
+        self.clear_cached_results_button.setToolTip(
+            "Forget cached results and known missing entries, so the next run searches everything again"
+        )
+        self.clear_cached_results_button.clicked.connect(self.clear_cached_results)
         self.process_button = QPushButton("Process File")
         self.process_button.clicked.connect(self.perform_auto_search)
+        process_button_layout.addWidget(self.clear_cached_results_button)
         process_button_layout.addStretch()
         process_button_layout.addWidget(self.process_button)
         auto_search_layout.addLayout(process_button_layout)
@@ -233,6 +434,20 @@ class SearchPanel(QWidget):
         # Set initial state
         self.toggle_search_mode()
     
+    def _create_completer(self):
+        """Create a case-insensitive completer matching anywhere in a value."""
+        completer = QCompleter(self)
+        completer.setModel(QStringListModel(completer))
+        completer.setCaseSensitivity(Qt.CaseInsensitive)
+        completer.setFilterMode(Qt.MatchContains)
+        return completer
+    
+    def update_completions(self):
+        """Reload the artist and title completions from the file index."""
+        cache_manager = self.music_indexer.cache_manager
+        self.artist_completer.model().setStringList(cache_manager.get_distinct_values('artist'))
+        self.title_completer.model().setStringList(cache_manager.get_distinct_values('title'))
+    
     def toggle_search_mode(self):
         """Toggle between manual, automatic, and enhanced automatic search modes."""
         manual_mode = self.manual_search_radio.isChecked()
@@ -249,26 +464,32 @@ class SearchPanel(QWidget):
                 "multi-artist handling, and format quality ranking. Uses fixed thresholds for consistency."
             )
             # Hide threshold slider for enhanced mode (it uses fixed optimized thresholds)
-            for i in range(self.threshold_layout.count()):
-                item = self.threshold_layout.itemAt(i)
-                if item.widget():
-                    item.widget().setVisible(False)
+            for widget in self.threshold_widgets:
+                widget.setVisible(False)
         elif auto_mode:
             self.algorithm_info_label.setText(
                 "🔍 Standard Algorithm: General-purpose fuzzy matching with configurable threshold."
             )
             # Show threshold slider for standard auto search
-            for i in range(self.threshold_layout.count()):
-                item = self.threshold_layout.itemAt(i)
-                if item.widget():
-                    item.widget().setVisible(True)
+            for widget in self.threshold_widgets:
+                widget.setVisible(True)
         else:
             self.algorithm_info_label.setText("")
     
     def _update_threshold_label(self, value):
         """Update threshold label when slider value changes."""
         self.threshold_label.setText(f"{value}%")
-        self.music_indexer.set_similarity_threshold(value)
+        self._threshold_timer.start()
+    
+    def _apply_threshold(self):
+        """Pass the slider's threshold on to the matcher."""
+        self._threshold_timer.stop()
+        self.music_indexer.set_similarity_threshold(self.threshold_slider.value())
+    
+    def _apply_pending_threshold(self):
+        """Apply a threshold change that is still waiting for the slider to settle."""
+        if self._threshold_timer.isActive():
+            self._apply_threshold()
     
     def browse_match_file(self):
         """Browse for a match file using app root as default directory."""
@@ -300,6 +521,8 @@ class SearchPanel(QWidget):
     
     def perform_manual_search(self):
         """Perform manual search."""
+        self._apply_pending_threshold()
+        
         # Get search parameters
         query = self.query_input.text().strip()
         artist = self.artist_input.text().strip()
@@ -320,23 +543,52 @@ class SearchPanel(QWidget):
             )
             return
         
-        # Perform search
-        results = self.music_indexer.search_files(
-            query=query,
-            artist=artist,
-            title=title,
-            format_type=format_type,
-            exact_match=exact_match
+        # Repeating a search against an unchanged index reuses its results
+        index_version = self.music_indexer.cache_manager.get_index_version()
+        key = None
+        if index_version is not None:
+            key = (query, artist, title, format_type, exact_match,
+                   self.threshold_slider.value(), tuple(index_version))
+            if key in self._search_cache:
+                self._search_cache.move_to_end(key)
+                logger.info("Manual search served from recent results")
+                self._manual_search_completed(self._search_cache[key])
+                return
+        
+        # Search on the thread pool so fuzzy scoring doesn't freeze the window;
+        # the button stays disabled until the results are back
+        self.search_button.setEnabled(False)
+        self._manual_search_key = key
+        self._manual_search_worker = SearchWorker(
+            lambda: self.music_indexer.search_files(
+                query=query,
+                artist=artist,
+                title=title,
+                format_type=format_type,
+                exact_match=exact_match
+            )
         )
-        
-        # Emit results
-        self.search_completed.emit(results)
+        self._manual_search_worker.signals.finished.connect(self._manual_search_completed)
+        QThreadPool.globalInstance().start(self._manual_search_worker)
         
         # Log search
         logger.info(
-            f"Manual search performed: query='{query}', artist='{artist}', "
+            f"Manual search started: query='{query}', artist='{artist}', "
             f"title='{title}', format='{format_type}', exact={exact_match}"
         )
+    
+    def _manual_search_completed(self, results):
+        """Handle manual search completion."""
+        if self._manual_search_worker is not None:
+            self._manual_search_worker = None
+            if self._manual_search_key is not None:
+                self._search_cache[self._manual_search_key] = results
+                if len(self._search_cache) > MAX_CACHED_SEARCHES:
+                    self._search_cache.popitem(last=False)
+        self.search_button.setEnabled(True)
+        
+        # Emit a copy so the cached list isn't shared with the results panel
+        self.search_completed.emit(list(results))
         
         # Show message if no results
         if not results:
@@ -348,6 +600,8 @@ class SearchPanel(QWidget):
     
     def perform_auto_search(self):
         """Perform automatic search from match file."""
+        self._apply_pending_threshold()
+        
         # Get match file
         match_file = self.file_input.text()
         
@@ -362,69 +616,46 @@ class SearchPanel(QWidget):
         # Determine which algorithm to use
         use_enhanced = self.enhanced_auto_search_radio.isChecked()
         
-        # Create progress dialog
+        # Settings that change the results, so cached results are only reused when they match
+        if use_enhanced:
+            cache_settings = {
+                'algorithm': 'enhanced',
+                'ignore_suffixes': self.music_indexer.config_manager.get("search", "ignore_suffixes", None)
+            }
+        else:
+            cache_settings = {
+                'algorithm': 'standard',
+                'threshold': self.music_indexer.string_matcher.threshold
+            }
+        
+        # Create the progress dialog once, then reset it for later searches
         algorithm_name = "Enhanced" if use_enhanced else "Standard"
-        self.auto_progress = QProgressDialog(f"Processing with {algorithm_name} algorithm...", "Cancel", 0, 100, self)
-        self.auto_progress.setWindowTitle("Processing")
-        self.auto_progress.setWindowModality(Qt.NonModal)
-        self.auto_progress.setMinimumDuration(0)
-        self.auto_progress.setAutoClose(False)
-        self.auto_progress.setAutoReset(False)
-        
-        # Create worker using Qt's thread pool
-        from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
-        
-        class AutoSearchWorker(QRunnable):
-            """Worker for automatic search in a separate thread."""
-            
-            class Signals(QObject):
-                """Worker signals."""
-                progress = pyqtSignal(float, str)
-                finished = pyqtSignal(list)
-                
-            def __init__(self, music_indexer, match_file, use_enhanced):
-                """Initialize the worker."""
-                super().__init__()
-                self.music_indexer = music_indexer
-                self.match_file = match_file
-                self.use_enhanced = use_enhanced
-                self.signals = self.Signals()
-                self.cancelled = False
+        if self.auto_progress is None:
+            self.auto_progress = QProgressDialog("", "Cancel", 0, 100, self)
+            self.auto_progress.setWindowTitle("Processing")
+            self.auto_progress.setWindowModality(Qt.NonModal)
+            self.auto_progress.setMinimumDuration(0)
+            self.auto_progress.setAutoClose(False)
+            self.auto_progress.setAutoReset(False)
             
-            @pyqtSlot()
-            def run(self):
-                """Run the worker."""
-                try:
-                    if self.use_enhanced:
-                        # Use optimized matcher
-                        from ..search.optimized_matcher import OptimizedMatcher
-                        matcher = OptimizedMatcher(self.music_indexer.cache_manager, self.music_indexer.config_manager)
-                        results = matcher.process_match_file(self.match_file, show_progress=False)
-                    else:
-                        # Use standard auto search
-                        results = self.music_indexer.process_match_file(
-                            self.match_file, 
-                            show_progress=False
-                        )
-                    
-                    # Emit finished signal with results
-                    self.signals.finished.emit(results)
-                
-                except Exception as e:
-                    logger.error(f"Error in auto search worker: {str(e)}")
-                    import traceback
-                    logger.error(traceback.format_exc())
-                    self.signals.finished.emit([])
+            # Handle cancel button
+            self.auto_progress.canceled.connect(self._cancel_auto_search)
+        else:
+            self.auto_progress.reset()
+            self.auto_progress.setMaximum(100)
+        self.auto_progress.setLabelText(f"Processing with {algorithm_name} algorithm...")
         
         # Create worker
-        worker = AutoSearchWorker(self.music_indexer, match_file, use_enhanced)
+        worker = AutoSearchWorker(
+            self.music_indexer, match_file, use_enhanced,
+            self.match_result_cache, cache_settings
+        )
+        self._auto_worker = worker
         
         # Connect signals
+        worker.signals.search_progress.connect(self._auto_search_progress)
         worker.signals.finished.connect(self.auto_search_completed)
         
-        # Handle cancel button
-        self.auto_progress.canceled.connect(lambda: setattr(worker, 'cancelled', True))
-        
         # Start worker
         QThreadPool.globalInstance().start(worker)
         
@@ -435,48 +666,66 @@ class SearchPanel(QWidget):
         algorithm_name = "Enhanced (Optimized)" if use_enhanced else "Standard"
         logger.info(f"Starting {algorithm_name} automatic search: {match_file}")
 
-    def auto_search_completed(self, results):
+    def _cancel_auto_search(self):
+        """Ask the running automatic search to stop."""
+        if self._auto_worker is not None:
+            self._auto_worker.cancelled = True
+    
+    def clear_cached_results(self):
+        """Remove cached search results and known missing entries."""
+        self.match_result_cache.clear()
+        self.not_found_cache.clear()
+        self._search_cache.clear()
+        logger.info("Cleared cached search results")
+    
+    def _auto_search_progress(self, processed, total, matched):
+        """Show how far the automatic search has got."""
+        # setValue would show a cancelled dialog again
+        if self.auto_progress is not None and not self.auto_progress.wasCanceled():
+            self.auto_progress.setMaximum(total)
+            self.auto_progress.setValue(processed)
+            self.auto_progress.setLabelText(
+                f"Processing match file: {processed} of {total} done, {matched} matched so far..."
+            )
+    
+    def auto_search_completed(self, results, summary):
         """Handle automatic search completion."""
+        self._auto_worker = None
+        
         # Close progress dialog
-        if hasattr(self, 'auto_progress') and self.auto_progress:
+        if self.auto_progress is not None:
             self.auto_progress.close()
         
-        algorithm_name = "Enhanced" if self.enhanced_auto_search_radio.isChecked() else "Standard"
+        use_enhanced = self.enhanced_auto_search_radio.isChecked()
+        algorithm_name = "Enhanced" if use_enhanced else "Standard"
+        cancelled = summary.get('cancelled', False)
         
         if results:
             # Emit results directly
             self.search_completed.emit(results)
             
-            # Count matches
-            total_matches = sum(len(result.get('matches', [])) for result in results)
-            missing_entries = sum(1 for result in results if not result.get('matches', []))
+            # Counts were taken by the worker
+            total_matches = summary['total_matches']
+            missing_entries = summary['missing_entries']
+            perfect_matches = summary['perfect_matches']
+            high_quality_matches = summary['high_quality_matches']
             
+            outcome = "cancelled" if cancelled else "completed"
             logger.info(
-                f"{algorithm_name} automatic search completed: processed {len(results)} entries, "
+                f"{algorithm_name} automatic search {outcome}: processed {len(results)} entries, "
                 f"found {total_matches} matches, {missing_entries} entries with no matches"
             )
             
+            # Partial results only cover the entries before the cancel
+            title_outcome = "Cancelled" if cancelled else "Complete"
+            cancel_note = "⏹ Processing was cancelled; the rest of the match file was not searched.\n\n" if cancelled else ""
+            
             # Show enhanced summary for optimized matcher
-            if self.enhanced_auto_search_radio.isChecked():
-                # Calculate additional statistics for enhanced algorithm
-                perfect_matches = 0
-                high_quality_matches = 0
-                
-                for result in results:
-                    matches = result.get('matches', [])
-                    if matches:
-                        best_match = matches[0]
-                        score = best_match.get('match_score', 0)
-                        strategy = best_match.get('strategy', '')
-                        
-                        if 'perfect_remix_match' in strategy:
-                            perfect_matches += 1
-                        elif score >= 90:
-                            high_quality_matches += 1
-                
+            if use_enhanced:
                 QMessageBox.information(
                     self,
-                    "Enhanced Processing Complete",
+                    f"Enhanced Processing {title_outcome}",
+                    f"{cancel_note}"
                     f"🎵 Enhanced Algorithm Results:\n\n"
                     f"📊 Processed: {len(results)} entries\n"
                     f"✅ Found matches: {len(results) - missing_entries}\n"
@@ -490,11 +739,15 @@ class SearchPanel(QWidget):
                 # Standard summary
                 QMessageBox.information(
                     self,
-                    "Processing Complete",
+                    f"Processing {title_outcome}",
+                    f"{cancel_note}"
                     f"Processed {len(results)} entries from match file.\n"
                     f"Found {total_matches} matching files.\n"
                     f"Entries with no matches: {missing_entries}"
                 )
+        elif cancelled:
+            # Cancelled before any entry finished; nothing failed
+            logger.info(f"{algorithm_name} automatic search cancelled before any entries were processed")
         else:
             QMessageBox.warning(
                 self,
@@ -504,20 +757,28 @@ class SearchPanel(QWidget):
     
     def load_settings(self):
         """Load panel settings."""
-        settings = QSettings("MusicIndexer", "MusicIndexer")
-        
-        # Load search mode
-        search_mode = settings.value("search/mode", "manual")
-        if search_mode == "enhanced_auto":
-            self.enhanced_auto_search_radio.setChecked(True)
-        elif search_mode == "auto":
-            self.auto_search_radio.setChecked(True)
-        else:
-            self.manual_search_radio.setChecked(True)
+        settings = self._get_settings()
+        
+        # Set the mode and threshold quietly, then update the panel once
+        with QSignalBlocker(self.manual_search_radio), \
+                QSignalBlocker(self.auto_search_radio), \
+                QSignalBlocker(self.enhanced_auto_search_radio), \
+                QSignalBlocker(self.threshold_slider):
+            # Load search mode
+            search_mode = settings.value("search/mode", "manual")
+            if search_mode == "enhanced_auto":
+                self.enhanced_auto_search_radio.setChecked(True)
+            elif search_mode == "auto":
+                self.auto_search_radio.setChecked(True)
+            else:
+                self.manual_search_radio.setChecked(True)
+            
+            # Load threshold
+            threshold = settings.value("search/threshold", 75, type=int)
+            self.threshold_slider.setValue(threshold)
         
-        # Load threshold
-        threshold = settings.value("search/threshold", 75, type=int)
-        self.threshold_slider.setValue(threshold)
+        self.toggle_search_mode()
+        self._update_threshold_label(self.threshold_slider.value())
         
         # Load match file - check app root first for default
         match_file = settings.value("search/match_file", "")
@@ -534,7 +795,7 @@ class SearchPanel(QWidget):
     
     def save_settings(self):
         """Save panel settings."""
-        settings = QSettings("MusicIndexer", "MusicIndexer")
+        settings = self._get_settings()
         
         # Save search mode
         if self.enhanced_auto_search_radio.isChecked():
@@ -555,6 +816,9 @@ class SearchPanel(QWidget):
         
         # Save exact match
         settings.setValue("search/exact_match", self.exact_match_checkbox.isChecked())
+        
+        # Write all values out together
+        settings.sync()
     
     def closeEvent(self, event):
         """Handle panel close event."""
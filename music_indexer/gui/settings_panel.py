@@ -9,12 +9,212 @@ from PyQt5.QtWidgets import (
     QCheckBox, QSpinBox, QComboBox, QFormLayout, QLineEdit,
     QListWidgetItem, QAbstractItemView
 )
-from PyQt5.QtCore import Qt, QSettings
+from PyQt5.QtCore import Qt, QSettings, QTimer
 
 from ..utils.logger import get_logger
+from ..utils.app_paths import find_app_root_directory
 
 logger = get_logger()
 
+# Application stylesheets for the selected theme; "System Default" uses none
+DARK_STYLESHEET = """
+QMainWindow, QWidget {
+    background-color: #2b2b2b;
+    color: #ffffff;
+}
+QTabWidget::pane {
+    border: 1px solid #555555;
+    background-color: #2b2b2b;
+}
+QTabBar::tab {
+    background-color: #404040;
+    color: #ffffff;
+    padding: 8px 16px;
+    margin-right: 2px;
+}
+QTabBar::tab:selected {
+    background-color: #555555;
+}
+QGroupBox {
+    color: #ffffff;
+    border: 2px solid #555555;
+    border-radius: 5px;
+    margin-top: 1ex;
+    font-weight: bold;
+}
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 5px 0 5px;
+}
+QPushButton {
+    background-color: #404040;
+    color: #ffffff;
+    border: 1px solid #555555;
+    padding: 5px;
+    border-radius: 3px;
+}
+QPushButton:hover {
+    background-color: #505050;
+}
+QPushButton:pressed {
+    background-color: #606060;
+}
+QLineEdit, QTextEdit, QListWidget, QTreeWidget {
+    background-color: #404040;
+    color: #ffffff;
+    border: 1px solid #555555;
+}
+QComboBox {
+    background-color: #404040;
+    color: #ffffff;
+    border: 1px solid #555555;
+    padding: 2px;
+}
+QComboBox::drop-down {
+    border: none;
+}
+QComboBox::down-arrow {
+    image: none;
+    border-left: 4px solid transparent;
+    border-right: 4px solid transparent;
+    border-top: 4px solid #ffffff;
+}
+QSlider::groove:horizontal {
+    background-color: #404040;
+    height: 6px;
+    border-radius: 3px;
+}
+QSlider::handle:horizontal {
+    background-color: #ffffff;
+    width: 12px;
+    border-radius: 6px;
+}
+QCheckBox {
+    color: #ffffff;
+}
+QLabel {
+    color: #ffffff;
+}
+QMenuBar {
+    background-color: #2b2b2b;
+    color: #ffffff;
+}
+QMenuBar::item:selected {
+    background-color: #404040;
+}
+QMenu {
+    background-color: #2b2b2b;
+    color: #ffffff;
+    border: 1px solid #555555;
+}
+QMenu::item:selected {
+    background-color: #404040;
+}
+QStatusBar {
+    background-color: #2b2b2b;
+    color: #ffffff;
+}
+"""
+
+LIGHT_STYLESHEET = """
+QMainWindow, QWidget {
+    background-color: #ffffff;
+    color: #000000;
+}
+QTabWidget::pane {
+    border: 1px solid #cccccc;
+    background-color: #ffffff;
+}
+QTabBar::tab {
+    background-color: #f0f0f0;
+    color: #000000;
+    padding: 8px 16px;
+    margin-right: 2px;
+    border: 1px solid #cccccc;
+}
+QTabBar::tab:selected {
+    background-color: #ffffff;
+    border-bottom: 1px solid #ffffff;
+}
+QGroupBox {
+    color: #000000;
+    border: 2px solid #cccccc;
+    border-radius: 5px;
+    margin-top: 1ex;
+    font-weight: bold;
+}
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 5px 0 5px;
+}
+QPushButton {
+    background-color: #f0f0f0;
+    color: #000000;
+    border: 1px solid #cccccc;
+    padding: 5px;
+    border-radius: 3px;
+}
+QPushButton:hover {
+    background-color: #e0e0e0;
+}
+QPushButton:pressed {
+    background-color: #d0d0d0;
+}
+QLineEdit, QTextEdit, QListWidget, QTreeWidget {
+    background-color: #ffffff;
+    color: #000000;
+    border: 1px solid #cccccc;
+}
+QComboBox {
+    background-color: #ffffff;
+    color: #000000;
+    border: 1px solid #cccccc;
+    padding: 2px;
+}
+QSlider::groove:horizontal {
+    background-color: #e0e0e0;
+    height: 6px;
+    border-radius: 3px;
+}
+QSlider::handle:horizontal {
+    background-color: #0078d4;
+    width: 12px;
+    border-radius: 6px;
+}
+QCheckBox {
+    color: #000000;
+}
+QLabel {
+    color: #000000;
+}
+QMenuBar {
+    background-color: #f0f0f0;
+    color: #000000;
+}
+QMenuBar::item:selected {
+    background-color: #e0e0e0;
+}
+QMenu {
+    background-color: #ffffff;
+    color: #000000;
+    border: 1px solid #cccccc;
+}
+QMenu::item:selected {
+    background-color: #e0e0e0;
+}
+QStatusBar {
+    background-color: #f0f0f0;
+    color: #000000;
+}
+"""
+
+THEME_STYLESHEETS = {
+    "Dark": DARK_STYLESHEET,
+    "Light": LIGHT_STYLESHEET
+}
+
 
 class SettingsPanel(QWidget):
     """Enhanced settings panel for the Music Indexer application."""
@@ -24,6 +224,13 @@ class SettingsPanel(QWidget):
         super().__init__()
         
         self.music_indexer = music_indexer
+        self._settings = QSettings("MusicIndexer", "MusicIndexer")
+        
+        # Apply the threshold once the slider has settled instead of on every tick
+        self._threshold_timer = QTimer(self)
+        self._threshold_timer.setSingleShot(True)
+        self._threshold_timer.setInterval(150)
+        self._threshold_timer.timeout.connect(self._apply_threshold)
         
         # Set up UI
         self.init_ui()
@@ -40,19 +247,7 @@ class SettingsPanel(QWidget):
         Returns:
             str: Path to app root directory
         """
-        # Get the directory where main.py is located
-        # Since we're in music_indexer/gui/settings_panel.py, we need to go up 2 levels
-        current_file = os.path.abspath(__file__)
-        app_root = os.path.dirname(os.path.dirname(os.path.dirname(current_file)))
-        
-        # Verify that main.py exists in this directory
-        main_py_path = os.path.join(app_root, "main.py")
-        if os.path.exists(main_py_path):
-            return app_root
-        else:
-            # Fallback to current working directory if main.py not found
-            logger.warning(f"main.py not found at {main_py_path}, using current working directory")
-            return os.getcwd()
+        return find_app_root_directory()
     
     def init_ui(self):
         """Initialize the user interface."""
@@ -147,6 +342,12 @@ class SettingsPanel(QWidget):
         self.recursive_scan_checkbox.setChecked(True)
         search_layout.addRow("", self.recursive_scan_checkbox)
         
+        # Turns the load confirmation back on after "Don't ask again"
+        self.confirm_load_checkbox = QCheckBox("Confirm before loading saved results")
+        self.confirm_load_checkbox.setChecked(True)
+        self.confirm_load_checkbox.setToolTip("Show file details, including missing files, before loading saved auto search results")
+        search_layout.addRow("", self.confirm_load_checkbox)
+        
         main_layout.addWidget(search_group)
         
         # Create auto-selection preferences group
@@ -343,7 +544,12 @@ class SettingsPanel(QWidget):
     def _update_threshold_label(self, value):
         """Update threshold label when slider value changes."""
         self.threshold_label.setText(f"{value}%")
-        self.music_indexer.set_similarity_threshold(value)
+        self._threshold_timer.start()
+    
+    def _apply_threshold(self):
+        """Pass the slider's threshold on to the matcher."""
+        self._threshold_timer.stop()
+        self.music_indexer.set_similarity_threshold(self.threshold_slider.value())
 
     def _update_min_score_label(self, value):
         """Update minimum score label when slider value changes."""
@@ -356,9 +562,7 @@ class SettingsPanel(QWidget):
     def update_directory_list(self):
         """Update the directory list widget."""
         self.directory_list.clear()
-        directories = self.music_indexer.get_music_directories()
-        for directory in directories:
-            self.directory_list.addItem(directory)
+        self.directory_list.addItems(self.music_indexer.get_music_directories())
         self._update_dir_buttons()
     
     def add_directory(self):
@@ -423,7 +627,7 @@ class SettingsPanel(QWidget):
     
     def load_settings(self):
         """Load panel settings."""
-        settings = QSettings("MusicIndexer", "MusicIndexer")
+        settings = self._settings
         
         # Load existing settings
         threshold = settings.value("search/threshold", 75, type=int)
@@ -432,6 +636,9 @@ class SettingsPanel(QWidget):
         recursive = settings.value("indexing/recursive", True, type=bool)
         self.recursive_scan_checkbox.setChecked(recursive)
         
+        skip_confirm = settings.value("load/skip_confirm", False, type=bool)
+        self.confirm_load_checkbox.setChecked(not skip_confirm)
+        
         supported_formats = self.music_indexer.config_manager.get_supported_formats()
         for fmt, checkbox in self.format_checkboxes.items():
             checkbox.setChecked(fmt in supported_formats)
@@ -468,15 +675,25 @@ class SettingsPanel(QWidget):
     
     def save_settings(self):
         """Save panel settings."""
-        settings = QSettings("MusicIndexer", "MusicIndexer")
+        settings = self._settings
         
-        # Save existing settings
+        # Save existing settings; unchanged values are skipped so an unchanged
+        # save doesn't rewrite the settings file
         threshold = self.threshold_slider.value()
-        settings.setValue("search/threshold", threshold)
+        self._threshold_timer.stop()
+        settings.beginGroup("search")
+        self._set_if_changed("threshold", threshold)
+        settings.endGroup()
         self.music_indexer.set_similarity_threshold(threshold)
         
         recursive = self.recursive_scan_checkbox.isChecked()
-        settings.setValue("indexing/recursive", recursive)
+        settings.beginGroup("indexing")
+        self._set_if_changed("recursive", recursive)
+        settings.endGroup()
+        
+        settings.beginGroup("load")
+        self._set_if_changed("skip_confirm", not self.confirm_load_checkbox.isChecked())
+        settings.endGroup()
         
         supported_formats = []
         for fmt, checkbox in self.format_checkboxes.items():
@@ -489,15 +706,19 @@ class SettingsPanel(QWidget):
         self.music_indexer.config_manager.set("paths", "default_export_directory", export_dir)
         
         theme = self.theme_combo.currentText()
-        settings.setValue("appearance/theme", theme)
+        settings.beginGroup("appearance")
+        self._set_if_changed("theme", theme)
+        settings.endGroup()
         self._apply_theme(theme)
         
         # Save auto-selection settings
-        settings.setValue("auto_select/enabled", self.enable_auto_select.isChecked())
-        settings.setValue("auto_select/min_score", self.min_score_slider.value())
-        settings.setValue("auto_select/format_preferences", self.get_format_preferences())
-        settings.setValue("auto_select/prefer_higher_bitrate", self.prefer_higher_bitrate.isChecked())
-        settings.setValue("auto_select/score_tolerance", self.score_tolerance_spin.value())
+        settings.beginGroup("auto_select")
+        self._set_if_changed("enabled", self.enable_auto_select.isChecked())
+        self._set_if_changed("min_score", self.min_score_slider.value())
+        self._set_if_changed("format_preferences", self.get_format_preferences())
+        self._set_if_changed("prefer_higher_bitrate", self.prefer_higher_bitrate.isChecked())
+        self._set_if_changed("score_tolerance", self.score_tolerance_spin.value())
+        settings.endGroup()
         
         # Save ignore suffixes
         suffixes_text = self.ignore_suffixes_input.text().strip()
@@ -513,216 +734,26 @@ class SettingsPanel(QWidget):
             "Settings saved successfully. Auto-selection preferences will be applied to future searches."
         )
     
+    def _set_if_changed(self, key, value):
+        """Write a setting only when it differs from the stored value."""
+        if self._settings.contains(key) and self._settings.value(key, type=type(value)) == value:
+            return
+        self._settings.setValue(key, value)
+    
     def _apply_theme(self, theme):
         """Apply the selected theme."""
         from PyQt5.QtWidgets import QApplication
         
         app = QApplication.instance()
         
-        if theme == "Dark":
-            # Apply dark theme stylesheet
-            dark_style = """
-            QMainWindow, QWidget {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-            QTabWidget::pane {
-                border: 1px solid #555555;
-                background-color: #2b2b2b;
-            }
-            QTabBar::tab {
-                background-color: #404040;
-                color: #ffffff;
-                padding: 8px 16px;
-                margin-right: 2px;
-            }
-            QTabBar::tab:selected {
-                background-color: #555555;
-            }
-            QGroupBox {
-                color: #ffffff;
-                border: 2px solid #555555;
-                border-radius: 5px;
-                margin-top: 1ex;
-                font-weight: bold;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-            QPushButton {
-                background-color: #404040;
-                color: #ffffff;
-                border: 1px solid #555555;
-                padding: 5px;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #505050;
-            }
-            QPushButton:pressed {
-                background-color: #606060;
-            }
-            QLineEdit, QTextEdit, QListWidget, QTreeWidget {
-                background-color: #404040;
-                color: #ffffff;
-                border: 1px solid #555555;
-            }
-            QComboBox {
-                background-color: #404040;
-                color: #ffffff;
-                border: 1px solid #555555;
-                padding: 2px;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 4px solid transparent;
-                border-right: 4px solid transparent;
-                border-top: 4px solid #ffffff;
-            }
-            QSlider::groove:horizontal {
-                background-color: #404040;
-                height: 6px;
-                border-radius: 3px;
-            }
-            QSlider::handle:horizontal {
-                background-color: #ffffff;
-                width: 12px;
-                border-radius: 6px;
-            }
-            QCheckBox {
-                color: #ffffff;
-            }
-            QLabel {
-                color: #ffffff;
-            }
-            QMenuBar {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-            QMenuBar::item:selected {
-                background-color: #404040;
-            }
-            QMenu {
-                background-color: #2b2b2b;
-                color: #ffffff;
-                border: 1px solid #555555;
-            }
-            QMenu::item:selected {
-                background-color: #404040;
-            }
-            QStatusBar {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-            """
-            app.setStyleSheet(dark_style)
-            logger.info("Applied dark theme")
-            
-        elif theme == "Light":
-            # Apply light theme stylesheet
-            light_style = """
-            QMainWindow, QWidget {
-                background-color: #ffffff;
-                color: #000000;
-            }
-            QTabWidget::pane {
-                border: 1px solid #cccccc;
-                background-color: #ffffff;
-            }
-            QTabBar::tab {
-                background-color: #f0f0f0;
-                color: #000000;
-                padding: 8px 16px;
-                margin-right: 2px;
-                border: 1px solid #cccccc;
-            }
-            QTabBar::tab:selected {
-                background-color: #ffffff;
-                border-bottom: 1px solid #ffffff;
-            }
-            QGroupBox {
-                color: #000000;
-                border: 2px solid #cccccc;
-                border-radius: 5px;
-                margin-top: 1ex;
-                font-weight: bold;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-            QPushButton {
-                background-color: #f0f0f0;
-                color: #000000;
-                border: 1px solid #cccccc;
-                padding: 5px;
-                border-radius: 3px;
-            }
-            QPushButton:hover {
-                background-color: #e0e0e0;
-            }
-            QPushButton:pressed {
-                background-color: #d0d0d0;
-            }
-            QLineEdit, QTextEdit, QListWidget, QTreeWidget {
-                background-color: #ffffff;
-                color: #000000;
-                border: 1px solid #cccccc;
-            }
-            QComboBox {
-                background-color: #ffffff;
-                color: #000000;
-                border: 1px solid #cccccc;
-                padding: 2px;
-            }
-            QSlider::groove:horizontal {
-                background-color: #e0e0e0;
-                height: 6px;
-                border-radius: 3px;
-            }
-            QSlider::handle:horizontal {
-                background-color: #0078d4;
-                width: 12px;
-                border-radius: 6px;
-            }
-            QCheckBox {
-                color: #000000;
-            }
-            QLabel {
-                color: #000000;
-            }
-            QMenuBar {
-                background-color: #f0f0f0;
-                color: #000000;
-            }
-            QMenuBar::item:selected {
-                background-color: #e0e0e0;
-            }
-            QMenu {
-                background-color: #ffffff;
-                color: #000000;
-                border: 1px solid #cccccc;
-            }
-            QMenu::item:selected {
-                background-color: #e0e0e0;
-            }
-            QStatusBar {
-                background-color: #f0f0f0;
-                color: #000000;
-            }
-            """
-            app.setStyleSheet(light_style)
-            logger.info("Applied light theme")
-            
-        else:  # System Default
-            app.setStyleSheet("")
-            logger.info("Applied system default theme")
+        stylesheet = THEME_STYLESHEETS.get(theme, "")
+        
+        # setStyleSheet re-polishes every widget, so skip it when the theme is already applied
+        if app.styleSheet() == stylesheet:
+            return
+        
+        app.setStyleSheet(stylesheet)
+        logger.info(f"Applied {theme} theme")
     
     def closeEvent(self, event):
         """Handle panel close event."""
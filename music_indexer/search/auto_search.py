@@ -4,16 +4,99 @@ CRITICAL FIX: Handles filenames like "01-omi_-_the_claim-nrg.mp3" correctly.
 """
 import os
 import re
+import sys
 from tqdm import tqdm
 from fuzzywuzzy import fuzz
 
 from ..core.cache_manager import CacheManager
-from ..search.string_matcher import StringMatcher
+from ..search.string_matcher import StringMatcher, clean_cache, max_ratio_for_lengths, trim_clean_caches
 from ..utils.logger import get_logger
 from ..utils.enhanced_playlist_parser import enhance_auto_search_with_parser
 
 logger = get_logger()
 
+# Enhanced stop words for electronic music
+ELECTRONIC_STOP_WORDS = frozenset({
+    'the', 'and', 'or', 'of', 'in', 'on', 'at', 'to', 'a', 'an', 'is', 'are', 
+    'was', 'were', 'vs', 'feat', 'ft', 'dj', 'mc', 'remix', 'mix', 'edit',
+    'original', 'radio', 'extended', 'club', 'vocal', 'instrumental',
+    'remaster', 'remastered', 'rework', 'bootleg', 'mashup', 'vol', 'pt',
+    'part', 'ep', 'lp', 'single', 'promo', 'white', 'label', 'vinyl',
+    'digital', 'wav', 'mp3', 'flac', 'kbps', 'hz', 'nrg'
+})
+
+
+@clean_cache
+def _clean_electronic_string(text):
+    """Clean a string for EnhancedStringMatcher.clean_string."""
+    if not text:
+        return ""
+    
+    # Convert to lowercase
+    text = text.lower()
+    
+    # Remove file extensions
+    text = re.sub(r'\.(mp3|flac|m4a|aac|wav|ogg)$', '', text, flags=re.IGNORECASE)
+    
+    # CRITICAL FIX: Remove track numbers at the beginning
+    # This fixes the "01" artist problem you found
+    track_patterns = [
+        r'^\d{1,3}[-_\.\s]+',       # 01-, 001_, 1., 01 
+        r'^[a-z]\d{1,2}[-_\.\s]+',  # a01-, b1_, etc.
+        r'^[a-z]{2,5}\d*[-_\.\s]+', # nrg01-, promo_, etc.
+    ]
+    
+    for pattern in track_patterns:
+        text = re.sub(pattern, '', text)
+    
+    # CRITICAL FIX: Handle underscore patterns properly
+    # This is key for your files with underscores
+    text = re.sub(r'_-_', ' - ', text)  # artist_-_title -> artist - title
+    text = re.sub(r'_+', ' ', text)     # multiple underscores -> space
+    
+    # Replace other separators with spaces, but be careful with dashes
+    text = re.sub(r'[.]', ' ', text)
+    text = re.sub(r'[-]', ' ', text)  # Convert dashes to spaces for better word matching
+    
+    # Remove remix/version info that adds noise
+    remix_patterns = [
+        r'\s+(original\s+)?mix\s*$',
+        r'\s+(radio\s+)?(edit|version)\s*$',
+        r'\s+remaster(ed)?\s*$',
+        r'\s+\d{4}\s*$',  # Remove years
+    ]
+    
+    for pattern in remix_patterns:
+        text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+    
+    # Normalize whitespace
+    text = re.sub(r'\s+', ' ', text)
+    text = text.strip()
+    
+    return sys.intern(text)
+
+
+@clean_cache
+def _electronic_meaningful_words(text):
+    """Meaningful words for EnhancedStringMatcher.extract_meaningful_words."""
+    if not text:
+        return ()
+    
+    # Split into words
+    words = text.split()
+    
+    meaningful_words = []
+    for word in words:
+        # Filter criteria - be more strict to avoid noise
+        if (len(word) >= 3 and 
+            word.lower() not in ELECTRONIC_STOP_WORDS and 
+            not word.isdigit() and
+            not re.match(r'^\d+$', word) and
+            not re.match(r'^[a-z]\d+$', word.lower())):  # Skip things like "a1", "b2"
+            meaningful_words.append(sys.intern(word))
+    
+    return tuple(meaningful_words)
+
 
 class EnhancedStringMatcher(StringMatcher):
     """
@@ -25,51 +108,7 @@ class EnhancedStringMatcher(StringMatcher):
         Enhanced clean_string method for electronic music files.
         CRITICAL: Fixes track number parsing issues.
         """
-        if not text:
-            return ""
-        
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Remove file extensions
-        text = re.sub(r'\.(mp3|flac|m4a|aac|wav|ogg)$', '', text, flags=re.IGNORECASE)
-        
-        # CRITICAL FIX: Remove track numbers at the beginning
-        # This fixes the "01" artist problem you found
-        track_patterns = [
-            r'^\d{1,3}[-_\.\s]+',       # 01-, 001_, 1., 01 
-            r'^[a-z]\d{1,2}[-_\.\s]+',  # a01-, b1_, etc.
-            r'^[a-z]{2,5}\d*[-_\.\s]+', # nrg01-, promo_, etc.
-        ]
-        
-        for pattern in track_patterns:
-            text = re.sub(pattern, '', text)
-        
-        # CRITICAL FIX: Handle underscore patterns properly
-        # This is key for your files with underscores
-        text = re.sub(r'_-_', ' - ', text)  # artist_-_title -> artist - title
-        text = re.sub(r'_+', ' ', text)     # multiple underscores -> space
-        
-        # Replace other separators with spaces, but be careful with dashes
-        text = re.sub(r'[.]', ' ', text)
-        text = re.sub(r'[-]', ' ', text)  # Convert dashes to spaces for better word matching
-        
-        # Remove remix/version info that adds noise
-        remix_patterns = [
-            r'\s+(original\s+)?mix\s*$',
-            r'\s+(radio\s+)?(edit|version)\s*$',
-            r'\s+remaster(ed)?\s*$',
-            r'\s+\d{4}\s*$',  # Remove years
-        ]
-        
-        for pattern in remix_patterns:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE)
-        
-        # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text)
-        text = text.strip()
-        
-        return text
+        return _clean_electronic_string(text)
 
     def match_against_filename(self, query, filename):
         """
@@ -122,14 +161,17 @@ class EnhancedStringMatcher(StringMatcher):
             total_words = len(query_words)
             
             for query_word in query_words:
-                best_word_match = 0
-                for filename_word in filename_words:
-                    if len(query_word) >= 3 and len(filename_word) >= 3:
-                        word_similarity = fuzz.ratio(query_word, filename_word)
-                        best_word_match = max(best_word_match, word_similarity)
+                query_len = len(query_word)
+                if query_len < 3:
+                    continue
                 
-                if best_word_match >= 80:  # Good word match
-                    word_matches += 1
+                for filename_word in filename_words:
+                    filename_len = len(filename_word)
+                    # Words too different in length can't reach the 80 cutoff
+                    if filename_len >= 3 and max_ratio_for_lengths(query_len, filename_len) >= 80:
+                        if fuzz.ratio(query_word, filename_word) >= 80:  # Good word match
+                            word_matches += 1
+                            break
             
             if word_matches > 0:
                 word_score = (word_matches / total_words) * 90
@@ -184,34 +226,10 @@ class EnhancedStringMatcher(StringMatcher):
     def extract_meaningful_words(self, text):
         """
         Enhanced word extraction for electronic music.
-        """
-        if not text:
-            return []
-        
-        # Split into words
-        words = text.split()
-        
-        # Enhanced stop words for electronic music
-        stop_words = {
-            'the', 'and', 'or', 'of', 'in', 'on', 'at', 'to', 'a', 'an', 'is', 'are', 
-            'was', 'were', 'vs', 'feat', 'ft', 'dj', 'mc', 'remix', 'mix', 'edit',
-            'original', 'radio', 'extended', 'club', 'vocal', 'instrumental',
-            'remaster', 'remastered', 'rework', 'bootleg', 'mashup', 'vol', 'pt',
-            'part', 'ep', 'lp', 'single', 'promo', 'white', 'label', 'vinyl',
-            'digital', 'wav', 'mp3', 'flac', 'kbps', 'hz', 'nrg'
-        }
-        
-        meaningful_words = []
-        for word in words:
-            # Filter criteria - be more strict to avoid noise
-            if (len(word) >= 3 and 
-                word.lower() not in stop_words and 
-                not word.isdigit() and
-                not re.match(r'^\d+$', word) and
-                not re.match(r'^[a-z]\d+$', word.lower())):  # Skip things like "a1", "b2"
-                meaningful_words.append(word)
         
-        return meaningful_words
+        Returns a tuple of interned words.
+        """
+        return _electronic_meaningful_words(text)
 
 
 class AutoSearch:
@@ -501,8 +519,15 @@ class AutoSearch:
         
         return best_matches
     
-    def process_match_file(self, file_path, show_progress=True):
-        """Process a match file using enhanced electronic music support."""
+    def process_match_file(self, file_path, show_progress=True, not_found_cache=None, result_callback=None):
+        """
+        Process a match file using enhanced electronic music support.
+        
+        Entries in not_found_cache (a NotFoundCache) are not searched again,
+        and new misses are added to it. result_callback, if given, is called as
+        result_callback(result, processed, total) after each entry; returning
+        False stops processing and returns the results so far.
+        """
         entries = self._load_match_file(file_path)
         
         if not entries:
@@ -511,6 +536,7 @@ class AutoSearch:
         
         cache_stats = self.cache_manager.get_cache_stats()
         logger.info(f"Processing {len(entries)} entries against {cache_stats['total_files']} indexed files")
+        trim_clean_caches(cache_stats['total_files'])
         logger.info(f"Using enhanced electronic music support with threshold {self.string_matcher.threshold}")
         
         results = []
@@ -522,7 +548,12 @@ class AutoSearch:
         
         for line_num, parsed_info in entries:
             try:
-                matches = self._find_matches_for_entry(parsed_info)
+                if not_found_cache is not None and not_found_cache.contains(parsed_info['original_line']):
+                    matches = []
+                else:
+                    matches = self._find_matches_for_entry(parsed_info)
+                    if not matches and not_found_cache is not None:
+                        not_found_cache.add(parsed_info['original_line'])
                 
                 result = {
                     'line_num': line_num,
@@ -556,6 +587,11 @@ class AutoSearch:
             
             if show_progress:
                 progress_bar.update(1)
+            
+            if result_callback is not None and \
+                    result_callback(results[-1], len(results), len(entries)) is False:
+                logger.info(f"Fixed auto search stopped after {len(results)} of {len(entries)} entries")
+                break
         
         if show_progress:
             progress_bar.close()
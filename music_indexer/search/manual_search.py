@@ -3,7 +3,7 @@ Manual search module for searching music files.
 FIXED VERSION - Improved consistency and search logic
 """
 from ..core.cache_manager import CacheManager
-from ..search.string_matcher import StringMatcher
+from ..search.string_matcher import StringMatcher, trim_clean_caches
 from ..utils.logger import get_logger
 
 logger = get_logger()
@@ -42,7 +42,9 @@ class ManualSearch:
         Returns:
             list: List of matching file metadata
         """
-        if exact_match:
+        # A format-only search has nothing to score, so the database lists
+        # the files of that format just as it does for exact matching
+        if exact_match or not (query or artist or title or album):
             # Use database search for exact matching
             results = self.cache_manager.search_files(
                 query=query,
@@ -67,6 +69,7 @@ class ManualSearch:
             # Get all files from cache first
             all_files = self.cache_manager.get_all_files()
             logger.info(f"Retrieved {len(all_files)} files from cache for fuzzy search")
+            trim_clean_caches(len(all_files))
             
             # Pre-filter results based on format if specified
             if format_type:
@@ -0,0 +1,143 @@
+"""
+Disk cache of automatic search results.
+
+Results are keyed by the match file's contents, the algorithm settings and the
+version of the file index, so re-processing an unchanged match file against an
+unchanged library skips the fuzzy matching entirely.
+"""
+import os
+import json
+import hashlib
+
+from ..utils.logger import get_logger
+
+logger = get_logger()
+
+# Cached result files kept; the least recently written are removed first
+MAX_CACHED_RESULTS = 20
+
+# Bytes hashed per read when fingerprinting a match file
+HASH_CHUNK_SIZE = 1 << 20
+
+
+class MatchResultCache:
+    """
+    Stores match file results on disk next to the file index.
+    """
+
+    def __init__(self, cache_manager, cache_dir=None):
+        """
+        Initialize the result cache.
+
+        Args:
+            cache_manager (CacheManager): Cache manager whose index the results depend on
+            cache_dir (str): Directory for cached results (default: "match_results" next to the index)
+        """
+        self.cache_manager = cache_manager
+        self.cache_dir = cache_dir or os.path.join(
+            os.path.dirname(cache_manager.cache_file) or ".", "match_results"
+        )
+
+    def make_key(self, match_file, settings):
+        """
+        Build the cache key for a match file.
+
+        Args:
+            match_file (str): Path to the match file
+            settings (dict): Algorithm settings that affect the results (JSON serializable)
+
+        Returns:
+            str: Cache key, or None if the file or the index version can't be read
+        """
+        index_version = self.cache_manager.get_index_version()
+        if index_version is None:
+            return None
+
+        digest = hashlib.sha1()
+        try:
+            with open(match_file, 'rb') as f:
+                for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                    digest.update(chunk)
+        except OSError as e:
+            logger.error(f"Error reading match file for result cache: {str(e)}")
+            return None
+
+        digest.update(json.dumps([settings, index_version], sort_keys=True).encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, key):
+        """
+        Get cached results.
+
+        Args:
+            key (str): Cache key from make_key
+
+        Returns:
+            list: Cached results, or None on a miss
+        """
+        path = os.path.join(self.cache_dir, f"{key}.json")
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                results = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cached results {path}: {str(e)}")
+            return None
+
+        logger.info(f"Using cached results for match file ({len(results)} entries)")
+        return results
+
+    def put(self, key, results):
+        """
+        Store results and prune the oldest cached files.
+
+        Args:
+            key (str): Cache key from make_key
+            results (list): Results to cache
+        """
+        path = os.path.join(self.cache_dir, f"{key}.json")
+        tmp_path = f"{path}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(results, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not cache match results: {str(e)}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+
+        self._prune()
+
+    def clear(self):
+        """Remove every cached result file."""
+        for _, path in self._cached_files():
+            try:
+                os.remove(path)
+            except OSError as e:
+                logger.warning(f"Could not remove {path}: {str(e)}")
+
+    def _cached_files(self):
+        """List (mtime, path) for every cached result file."""
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                return [
+                    (entry.stat().st_mtime, entry.path)
+                    for entry in entries if entry.name.endswith('.json') and not entry.name.startswith('not_found_')
+                ]
+        except OSError:
+            return []
+
+    def _prune(self):
+        """Remove cached results beyond MAX_CACHED_RESULTS, oldest first."""
+        cached = self._cached_files()
+        cached.sort(reverse=True)
+        for _, path in cached[MAX_CACHED_RESULTS:]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
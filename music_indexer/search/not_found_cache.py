@@ -0,0 +1,117 @@
+"""
+Cross-session cache of match file entries that found nothing.
+
+An entry is only skipped while the algorithm settings and the file index are
+the ones it was scored against; any index change starts a fresh cache, so
+newly indexed music is always searched for.
+"""
+import os
+import json
+
+from ..utils.logger import get_logger
+
+logger = get_logger()
+
+# Bumped when the key format changes so older cache files are ignored
+CACHE_FORMAT = 2
+
+
+class NotFoundCache:
+    """
+    Set of match file lines that previously returned no matches.
+    """
+
+    def __init__(self, cache_dir):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir (str): Directory holding the cache files
+        """
+        self.cache_dir = cache_dir
+        self.path = None
+        self.version = None
+        self.keys = set()
+        self.dirty = False
+
+    @staticmethod
+    def make_key(line):
+        """
+        Normalized lookup key for an entry.
+
+        The whole line is used rather than the parsed artist and title, since
+        the matchers also search with the rest of the line (remix info, full
+        artist credits, line variants).
+        """
+        return (line or '').strip().lower()
+
+    def load(self, settings, index_version):
+        """
+        Load the cached misses for an algorithm and index version.
+
+        Args:
+            settings (dict): Algorithm settings, including an 'algorithm' name
+            index_version (list): Value from CacheManager.get_index_version()
+        """
+        self.path = os.path.join(self.cache_dir, f"not_found_{settings['algorithm']}.json")
+        self.version = [CACHE_FORMAT, settings, index_version]
+        self.keys = set()
+        self.dirty = False
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable not-found cache {self.path}: {str(e)}")
+            return
+
+        # Misses recorded against other settings or an older index no longer hold
+        if data.get('version') == self.version:
+            self.keys = set(data.get('keys', []))
+            logger.info(f"Loaded {len(self.keys)} known missing entries")
+
+    def contains(self, line):
+        """Check whether a match file line is known to have no matches."""
+        return self.make_key(line) in self.keys
+
+    def add(self, line):
+        """Record a match file line that found no matches."""
+        key = self.make_key(line)
+        if key not in self.keys:
+            self.keys.add(key)
+            self.dirty = True
+
+    def save(self):
+        """Write the cache if entries were added since it was loaded."""
+        if not self.dirty or self.path is None:
+            return
+
+        tmp_path = f"{self.path}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': self.version, 'keys': sorted(self.keys)}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not save not-found cache: {str(e)}")
+
+    def clear(self):
+        """Remove every stored not-found cache file."""
+        self.keys = set()
+        self.dirty = False
+
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                paths = [entry.path for entry in entries
+                         if entry.name.startswith('not_found_') and entry.name.endswith('.json')]
+        except OSError:
+            return
+
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError as e:
+                logger.warning(f"Could not remove {path}: {str(e)}")
@@ -5,13 +5,47 @@ Fixed the variable 'i' scope issue in debug logging
 """
 
 import os
+import sys
 import sqlite3
 import re
 from fuzzywuzzy import fuzz
+
+try:
+    from rapidfuzz import fuzz as rapid_fuzz, process as rapid_process
+except ImportError:  # Optional: titles are then scored file by file
+    rapid_fuzz = None
+    rapid_process = None
+
+from ..search.string_matcher import clean_cache, max_ratio_for_lengths, trim_clean_caches
 from ..utils.logger import get_logger
 
 logger = get_logger()
 
+# Title strategies need a title ratio of at least 80; one point lower keeps
+# rounding differences from dropping a file that would pass
+TITLE_CANDIDATE_CUTOFF = 79
+
+
+@clean_cache
+def _clean_text_for_matching(text, ignore_suffixes):
+    """Clean text for OptimizedMatcher.clean_text_for_matching, removing ignore_suffixes."""
+    if not text:
+        return ""
+    
+    text = text.lower()
+    text = re.sub(r'\s*\([^)]*(?:remix|mix|edit|version|remaster)\)', '', text)
+    text = re.sub(r'\s*-\s*[^-]*(?:remix|mix|edit|version|remaster)[^-]*$', '', text)
+    
+    # CONFIGURABLE: Remove user-defined suffixes
+    for suffix in ignore_suffixes:
+        if suffix.strip():  # Skip empty suffixes
+            pattern = rf'[-_]\s*{re.escape(suffix)}\s*$'
+            text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+    
+    text = re.sub(r'[^\w\s]', ' ', text)
+    text = re.sub(r'\s+', ' ', text)
+    return sys.intern(text.strip())
+
 
 class OptimizedMatcher:
     """Complete fixed optimized matcher with configurable suffix removal."""
@@ -36,6 +70,9 @@ class OptimizedMatcher:
             # Fallback to default list
             self.ignore_suffixes = ["justify", "sob", "nrg", "dps", "trt", "pms"]
         
+        # Cleaned text is cached per suffix list, see _clean_text_for_matching
+        self._suffix_key = tuple(self.ignore_suffixes)
+        
         # Electronic music labels from your collection
         self.known_labels = {
             'dps', 'trt', 'pms', 'sq', 'doc', 'vmc', 'dwm', 'apc', 'rfl', 'mim'
@@ -46,23 +83,7 @@ class OptimizedMatcher:
         
     def clean_text_for_matching(self, text):
         """Clean text for accurate matching with configurable suffix removal."""
-
-        if not text:
-            return ""
-        
-        text = text.lower()
-        text = re.sub(r'\s*\([^)]*(?:remix|mix|edit|version|remaster)\)', '', text)
-        text = re.sub(r'\s*-\s*[^-]*(?:remix|mix|edit|version|remaster)[^-]*$', '', text)
-        
-        # CONFIGURABLE: Remove user-defined suffixes
-        for suffix in self.ignore_suffixes:
-            if suffix.strip():  # Skip empty suffixes
-                pattern = rf'[-_]\s*{re.escape(suffix)}\s*$'
-                text = re.sub(pattern, '', text, flags=re.IGNORECASE)
-        
-        text = re.sub(r'[^\w\s]', ' ', text)
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
+        return _clean_text_for_matching(text, self._suffix_key)
     
     def parse_playlist_entry(self, line):
         """Parse playlist entry with improved remix detection."""
@@ -300,16 +321,16 @@ class OptimizedMatcher:
         clean_search_artist = self.clean_text_for_matching(search_artist)
         clean_db_artist = self.clean_text_for_matching(db_artist)
         
-        # Title matching
+        # Title matching; pairs whose lengths can't reach the cutoff are not scored
         title_score = 0
         if clean_search_title and clean_db_title:
-            title_score = fuzz.ratio(clean_search_title, clean_db_title)
+            search_len = len(clean_search_title)
+            db_len = len(clean_db_title)
+            title_cutoff = 90 if search_len <= 8 or db_len <= 8 else 80
             
-            if len(clean_search_title) <= 8 or len(clean_db_title) <= 8:
-                if title_score < 90:
-                    title_score = 0
-            else:
-                if title_score < 80:
+            if max_ratio_for_lengths(search_len, db_len) >= title_cutoff:
+                title_score = fuzz.ratio(clean_search_title, clean_db_title)
+                if title_score < title_cutoff:
                     title_score = 0
         
         # Enhanced Artist matching with variations
@@ -317,7 +338,8 @@ class OptimizedMatcher:
         if search_artist and db_artist:
             if search_variations:
                 artist_score = self.enhanced_artist_match_score(search_artist, search_variations, db_artist)
-            else:
+            elif clean_search_artist and clean_db_artist and \
+                    max_ratio_for_lengths(len(clean_search_artist), len(clean_db_artist)) >= 80:
                 artist_score = fuzz.ratio(clean_search_artist, clean_db_artist)
             
             if artist_score < 80:
@@ -453,6 +475,38 @@ class OptimizedMatcher:
         
         return bonus, bonus_reasons
     
+    def title_match_candidates(self, search_titles, all_files):
+        """
+        Find the files whose title is close enough to any search title to pass
+        the title strategies, scoring all titles in one rapidfuzz batch.
+        
+        Args:
+            search_titles (list): Titles to search for
+            all_files (list): File metadata dictionaries
+            
+        Returns:
+            set: Indexes into all_files, or None if every file is a candidate
+        """
+        if rapid_process is None:
+            return None
+        
+        clean_titles = [self.clean_text_for_matching(f.get('title', '')) for f in all_files]
+        
+        candidates = set()
+        for search_title in search_titles:
+            clean_search_title = self.clean_text_for_matching(search_title)
+            if not clean_search_title:
+                continue
+            
+            hits = rapid_process.extract(
+                clean_search_title, clean_titles,
+                scorer=rapid_fuzz.ratio, processor=None,
+                score_cutoff=TITLE_CANDIDATE_CUTOFF, limit=None
+            )
+            candidates.update(index for _, _, index in hits)
+        
+        return candidates
+    
     def search_for_entry(self, parsed_entry):
         """Search with improved remix-aware matching."""
         if not parsed_entry:
@@ -460,6 +514,7 @@ class OptimizedMatcher:
         
         # Get all files from database using cache manager
         all_files = self.cache_manager.get_all_files()
+        trim_clean_caches(len(all_files))
         
         matches = []
         search_artist = parsed_entry['artist']
@@ -471,7 +526,13 @@ class OptimizedMatcher:
         logger.debug(f"Improved search for: Artist='{search_artist}', Title='{search_title}', "
                     f"CleanTitle='{clean_search_title}', HasRemix={has_remix}")
         
-        for file_metadata in all_files:
+        search_full_title = has_remix and search_title != clean_search_title
+        title_candidates = self.title_match_candidates(
+            [clean_search_title, search_title] if search_full_title else [clean_search_title],
+            all_files
+        )
+        
+        for index, file_metadata in enumerate(all_files):
             file_path = file_metadata.get('file_path', '')
             filename = file_metadata.get('filename', '')
             db_artist = file_metadata.get('artist', '')
@@ -485,24 +546,26 @@ class OptimizedMatcher:
             # Calculate base scores using clean title for better matching
             base_scores = []
             
-            # Strategy 1: Artist + Clean Title matching (with variations)
-            if search_artist:
-                score1 = self.conservative_match_score(
-                    clean_search_title, db_title, search_artist, db_artist, search_variations
-                )
-                if score1 >= self.min_score:
-                    base_scores.append(('artist_title', score1))
-            
-            # Strategy 2: Clean Title-only matching
-            score2 = self.conservative_match_score(clean_search_title, db_title)
-            if score2 >= self.min_score:
-                base_scores.append(('title_only', score2))
-            
-            # Strategy 3: Full title matching (for remix-specific matching)
-            if has_remix and search_title != clean_search_title:
-                score3 = self.conservative_match_score(search_title, db_title)
-                if score3 >= self.min_score:
-                    base_scores.append(('full_title_remix', score3))
+            # Strategies 1-3 score 0 unless the title passes its cutoff
+            if title_candidates is None or index in title_candidates:
+                # Strategy 1: Artist + Clean Title matching (with variations)
+                if search_artist:
+                    score1 = self.conservative_match_score(
+                        clean_search_title, db_title, search_artist, db_artist, search_variations
+                    )
+                    if score1 >= self.min_score:
+                        base_scores.append(('artist_title', score1))
+                
+                # Strategy 2: Clean Title-only matching
+                score2 = self.conservative_match_score(clean_search_title, db_title)
+                if score2 >= self.min_score:
+                    base_scores.append(('title_only', score2))
+                
+                # Strategy 3: Full title matching (for remix-specific matching)
+                if search_full_title:
+                    score3 = self.conservative_match_score(search_title, db_title)
+                    if score3 >= self.min_score:
+                        base_scores.append(('full_title_remix', score3))
             
             # Strategy 4: Filename matching
             clean_filename = self.clean_text_for_matching(filename)
@@ -563,8 +626,15 @@ class OptimizedMatcher:
         
         return top_matches
     
-    def process_match_file(self, file_path, show_progress=True):
-        """Process a match file using the complete fixed optimized matcher."""
+    def process_match_file(self, file_path, show_progress=True, not_found_cache=None, result_callback=None):
+        """
+        Process a match file using the complete fixed optimized matcher.
+        
+        Entries in not_found_cache (a NotFoundCache) are not searched again,
+        and new misses are added to it. result_callback, if given, is called as
+        result_callback(result, processed_lines, total_lines) after each entry;
+        returning False stops processing and returns the results so far.
+        """
         if not os.path.exists(file_path):
             logger.error(f"Match file not found: {file_path}")
             return []
@@ -575,28 +645,39 @@ class OptimizedMatcher:
         
         try:
             with open(file_path, 'r', encoding='utf-8') as file:
-                for line_num, line in enumerate(file, 1):
-                    parsed_entry = self.parse_playlist_entry(line)
-                    
-                    if parsed_entry:
+                lines = file.readlines()
+            
+            for line_num, line in enumerate(lines, 1):
+                parsed_entry = self.parse_playlist_entry(line)
+                if parsed_entry:
+                    if not_found_cache is not None and not_found_cache.contains(parsed_entry['original']):
+                        matches = []
+                    else:
                         matches = self.search_for_entry(parsed_entry)
-                        
-                        result = {
-                            'line_num': line_num,
-                            'line': parsed_entry['original'],
-                            'artist': parsed_entry['artist'],
-                            'title': parsed_entry['title'],
-                            'matches': matches
-                        }
-                        results.append(result)
-                        
-                        if matches:
-                            best_score = matches[0]['match_score']
-                            strategy = matches[0]['strategy']
-                            logger.debug(f"Line {line_num}: '{parsed_entry['original']}' -> "
-                                       f"{len(matches)} matches (best: {best_score:.1f}% - {strategy})")
-                        else:
-                            logger.debug(f"Line {line_num}: '{parsed_entry['original']}' -> No matches")
+                        if not matches and not_found_cache is not None:
+                            not_found_cache.add(parsed_entry['original'])
+                    
+                    result = {
+                        'line_num': line_num,
+                        'line': parsed_entry['original'],
+                        'artist': parsed_entry['artist'],
+                        'title': parsed_entry['title'],
+                        'matches': matches
+                    }
+                    results.append(result)
+                    
+                    if matches:
+                        best_score = matches[0]['match_score']
+                        strategy = matches[0]['strategy']
+                        logger.debug(f"Line {line_num}: '{parsed_entry['original']}' -> "
+                                   f"{len(matches)} matches (best: {best_score:.1f}% - {strategy})")
+                    else:
+                        logger.debug(f"Line {line_num}: '{parsed_entry['original']}' -> No matches")
+                    
+                    if result_callback is not None and \
+                            result_callback(result, line_num, len(lines)) is False:
+                        logger.info(f"Optimized matching stopped at line {line_num} of {len(lines)}")
+                        break
         
         except Exception as e:
             logger.error(f"Error processing match file: {str(e)}")
@@ -4,11 +4,130 @@ Replace your string_matcher.py with this version immediately.
 """
 from fuzzywuzzy import fuzz
 import re
+import sys
+import functools
+
+try:
+    from rapidfuzz import fuzz as rapid_fuzz
+except ImportError:  # Optional: same ratio() scores without fuzzywuzzy's per-call wrappers
+    rapid_fuzz = None
 
 from ..utils.logger import get_logger
 logger = get_logger()
 
 
+# Distinct strings a pass over the library cleans per file: artist, title,
+# filename and the combined text used for word overlap
+CLEANED_STRINGS_PER_FILE = 4
+
+# Room in the cleaning caches for queries and their variants
+CLEAN_CACHE_SLACK = 1 << 12
+
+# Electronic music specific stop words shared by every StringMatcher
+STOP_WORDS = frozenset({
+    'the', 'and', 'or', 'of', 'in', 'on', 'at', 'to', 'a', 'an', 'is', 'are',
+    'vs', 'feat', 'ft', 'dj', 'mc', 'original', 'mix', 'remix', 'edit',
+    'extended', 'radio', 'club', 'dance', 'version', 'remaster', 'remastered'
+})
+
+_clean_caches = []
+
+
+def clean_cache(func):
+    """
+    Memoize a pure text-cleaning function in a module-level cache.
+    
+    Matchers compare every query against the whole library in the same
+    order, so a bounded LRU smaller than the library evicts each string just
+    before it is needed again. The caches are unbounded instead and emptied
+    by trim_clean_caches once they outgrow the library.
+    """
+    cached = functools.lru_cache(maxsize=None)(func)
+    _clean_caches.append(cached)
+    return cached
+
+
+def trim_clean_caches(file_count):
+    """
+    Empty cleaning caches holding more strings than a pass over the library needs.
+    
+    Called before each pass, so strings of renamed or removed files and old
+    queries don't accumulate.
+    
+    Args:
+        file_count (int): Number of files the pass compares against
+    """
+    limit = file_count * CLEANED_STRINGS_PER_FILE + CLEAN_CACHE_SLACK
+    for cached in _clean_caches:
+        if cached.cache_info().currsize > limit:
+            cached.cache_clear()
+
+
+if rapid_fuzz is not None:
+    def _ratio(str1, str2):
+        """fuzz.ratio computed by rapidfuzz, rounded the way fuzzywuzzy rounds it."""
+        return round(rapid_fuzz.ratio(str1, str2))
+else:
+    _ratio = fuzz.ratio
+
+
+def max_ratio_for_lengths(len1, len2):
+    """
+    Highest fuzz.ratio score two non-empty strings of these lengths can reach.
+    
+    ratio() is 2 * common characters / total length, and the common part is
+    at most the shorter string, so a pair whose bound is below a cutoff can
+    be rejected without scoring it.
+    """
+    return round(200 * min(len1, len2) / (len1 + len2))
+
+
+@clean_cache
+def _clean_string(text):
+    """Clean a string for StringMatcher.clean_string."""
+    if not text:
+        return ""
+    
+    # Convert to lowercase
+    text = text.lower()
+    
+    # Remove file extensions
+    text = re.sub(r'\.(mp3|flac|m4a|aac|wav|ogg)$', '', text, flags=re.IGNORECASE)
+    
+    # Replace separators with spaces (but be conservative)
+    text = re.sub(r'[_\-.]', ' ', text)
+    
+    # Remove remix info in parentheses
+    text = re.sub(r'\s*\([^)]*(?:remix|mix|edit|remaster|version|original|extended|radio|club)[^)]*\)\s*', ' ', text, flags=re.IGNORECASE)
+    
+    # Remove leading track numbers
+    text = re.sub(r'^\s*[a-z]?\d+\s*', '', text)
+    
+    # Normalize whitespace
+    text = re.sub(r'\s+', ' ', text)
+    text = text.strip()
+    
+    # Artists and words repeat across the library; share one copy of each
+    return sys.intern(text)
+
+
+@clean_cache
+def _meaningful_words(cleaned, stop_words):
+    """Meaningful words of a cleaned string for StringMatcher.extract_meaningful_words."""
+    words = cleaned.split()
+    
+    # Filter meaningful words STRICTLY
+    meaningful_words = []
+    for word in words:
+        if (len(word) >= 3 and  # At least 3 characters
+            word not in stop_words and  # Not a stop word
+            not word.isdigit() and  # Not just a number
+            len(word) <= 20):  # Not too long (likely garbage)
+            meaningful_words.append(sys.intern(word))
+    
+    return tuple(meaningful_words)
+
+
 class StringMatcher:
     """
     FIXED Conservative string matcher that eliminates false positives.
@@ -23,13 +142,7 @@ class StringMatcher:
             threshold (int): Similarity threshold (0-100) for fuzzy matching
         """
         self.threshold = threshold
-        
-        # Electronic music specific stop words
-        self.stop_words = {
-            'the', 'and', 'or', 'of', 'in', 'on', 'at', 'to', 'a', 'an', 'is', 'are',
-            'vs', 'feat', 'ft', 'dj', 'mc', 'original', 'mix', 'remix', 'edit',
-            'extended', 'radio', 'club', 'dance', 'version', 'remaster', 'remastered'
-        }
+        self.stop_words = STOP_WORDS
         
         logger.info(f"FIXED Conservative string matcher initialized with threshold {threshold}")
     
@@ -53,29 +166,7 @@ class StringMatcher:
         Returns:
             str: Cleaned string
         """
-        if not text:
-            return ""
-        
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Remove file extensions
-        text = re.sub(r'\.(mp3|flac|m4a|aac|wav|ogg)$', '', text, flags=re.IGNORECASE)
-        
-        # Replace separators with spaces (but be conservative)
-        text = re.sub(r'[_\-.]', ' ', text)
-        
-        # Remove remix info in parentheses
-        text = re.sub(r'\s*\([^)]*(?:remix|mix|edit|remaster|version|original|extended|radio|club)[^)]*\)\s*', ' ', text, flags=re.IGNORECASE)
-        
-        # Remove leading track numbers
-        text = re.sub(r'^\s*[a-z]?\d+\s*', '', text)
-        
-        # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text)
-        text = text.strip()
-        
-        return text
+        return _clean_string(text)
     
     def extract_meaningful_words(self, text):
         """
@@ -85,25 +176,12 @@ class StringMatcher:
             text (str): Input text
             
         Returns:
-            list: List of meaningful words
+            tuple: Meaningful words (interned); shared from a cache, hence immutable
         """
         if not text:
-            return []
-        
-        # Clean and split
-        cleaned = self.clean_string(text)
-        words = cleaned.split()
-        
-        # Filter meaningful words STRICTLY
-        meaningful_words = []
-        for word in words:
-            if (len(word) >= 3 and  # At least 3 characters
-                word not in self.stop_words and  # Not a stop word
-                not word.isdigit() and  # Not just a number
-                len(word) <= 20):  # Not too long (likely garbage)
-                meaningful_words.append(word)
-        
-        return meaningful_words
+            return ()
+        
+        return _meaningful_words(self.clean_string(text), self.stop_words)
     
     def calculate_word_overlap_score(self, search_words, target_words):
         """
@@ -176,7 +254,7 @@ class StringMatcher:
         fuzzy_score = 0
         if len(clean_str1) >= 3 and len(clean_str2) >= 3:
             # Use only the most conservative fuzzy method
-            ratio = fuzz.ratio(clean_str1, clean_str2)
+            ratio = _ratio(clean_str1, clean_str2)
             partial_ratio = fuzz.partial_ratio(clean_str1, clean_str2)
             
             # Be VERY careful with token_set_ratio - it causes false positives
@@ -0,0 +1,33 @@
+"""
+Application path helpers for the music indexer application.
+"""
+import os
+import functools
+
+from ..utils.logger import get_logger
+
+logger = get_logger()
+
+
+@functools.lru_cache(maxsize=1)
+def find_app_root_directory():
+    """
+    Get the app root directory (where main.py is located).
+    
+    The result is looked up once per run; the app root does not move while running.
+    
+    Returns:
+        str: Path to app root directory
+    """
+    # Since we're in music_indexer/utils/app_paths.py, we need to go up 2 levels
+    current_file = os.path.abspath(__file__)
+    app_root = os.path.dirname(os.path.dirname(os.path.dirname(current_file)))
+    
+    # Verify that main.py exists in this directory
+    main_py_path = os.path.join(app_root, "main.py")
+    if os.path.exists(main_py_path):
+        return app_root
+    else:
+        # Fallback to current working directory if main.py not found
+        logger.warning(f"main.py not found at {main_py_path}, using current working directory")
+        return os.getcwd()
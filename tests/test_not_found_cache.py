@@ -0,0 +1,88 @@
+"""
+Tests for the cross-session cache of match file entries without matches.
+"""
+import pytest
+
+from music_indexer.core.cache_manager import CacheManager
+from music_indexer.search.auto_search import AutoSearch
+from music_indexer.search.not_found_cache import NotFoundCache
+from music_indexer.search.optimized_matcher import OptimizedMatcher
+
+# Both lines parse to artist "Omega" and title "Sky Fall" in both matchers
+MISSED_LINE = "Omega - Sky Fall"
+OTHER_LINE = "Omega - Sky Fall - Omega Remix"
+
+
+@pytest.fixture
+def cache_manager(tmp_path):
+    """File index holding a single track."""
+    manager = CacheManager(str(tmp_path / "music_cache.db"))
+    manager.cache_file_metadata({
+        'file_path': str(tmp_path / "Omega - Sky Fall (Omega Remix).mp3"),
+        'filename': "Omega - Sky Fall (Omega Remix).mp3",
+        'artist': "Omega",
+        'title': "Sky Fall (Omega Remix)",
+        'format': "mp3"
+    })
+    return manager
+
+
+@pytest.fixture
+def not_found_cache(tmp_path, cache_manager):
+    """Not-found cache that has recorded MISSED_LINE as a miss."""
+    cache = NotFoundCache(str(tmp_path / "match_results"))
+    cache.load({'algorithm': 'test'}, cache_manager.get_index_version())
+    cache.add(MISSED_LINE)
+    return cache
+
+
+def test_lines_sharing_artist_and_title_have_separate_keys():
+    assert NotFoundCache.make_key(MISSED_LINE) != NotFoundCache.make_key(OTHER_LINE)
+    assert NotFoundCache.make_key("  OMEGA - Sky Fall \n") == NotFoundCache.make_key(MISSED_LINE)
+
+
+def test_misses_survive_save_and_load(tmp_path, not_found_cache, cache_manager):
+    not_found_cache.save()
+
+    cache = NotFoundCache(str(tmp_path / "match_results"))
+    cache.load({'algorithm': 'test'}, cache_manager.get_index_version())
+    assert cache.contains(MISSED_LINE)
+    assert not cache.contains(OTHER_LINE)
+
+    # Misses recorded against another index version no longer hold
+    cache.load({'algorithm': 'test'}, [0, 0, 0])
+    assert not cache.contains(MISSED_LINE)
+
+
+def test_auto_search_only_skips_the_missed_line(tmp_path, cache_manager, not_found_cache):
+    auto_search = AutoSearch(cache_manager)
+    match_file = tmp_path / "match.txt"
+    match_file.write_text(f"{MISSED_LINE}\n{OTHER_LINE}\n", encoding='utf-8')
+
+    parsed = [auto_search._parse_match_line(line) for line in (MISSED_LINE, OTHER_LINE)]
+    assert (parsed[0]['artist'], parsed[0]['title']) == (parsed[1]['artist'], parsed[1]['title'])
+
+    results = auto_search.process_match_file(
+        str(match_file), show_progress=False, not_found_cache=not_found_cache
+    )
+
+    assert [result['line'] for result in results] == [MISSED_LINE, OTHER_LINE]
+    assert results[0]['matches'] == []
+    assert results[1]['matches']
+
+
+def test_optimized_matcher_only_skips_the_missed_line(tmp_path, cache_manager, not_found_cache):
+    matcher = OptimizedMatcher(cache_manager)
+    match_file = tmp_path / "match.txt"
+    match_file.write_text(f"{MISSED_LINE}\n{OTHER_LINE}\n", encoding='utf-8')
+
+    parsed = [matcher.parse_playlist_entry(line) for line in (MISSED_LINE, OTHER_LINE)]
+    assert (parsed[0]['artist'], parsed[0]['title']) == (parsed[1]['artist'], parsed[1]['title'])
+
+    results = matcher.process_match_file(
+        str(match_file), show_progress=False, not_found_cache=not_found_cache
+    )
+
+    assert [result['line'] for result in results] == [MISSED_LINE, OTHER_LINE]
+    assert results[0]['matches'] == []
+    assert results[1]['matches']
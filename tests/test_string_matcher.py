@@ -0,0 +1,83 @@
+"""
+Tests for the string matchers' cleaning caches and word extraction.
+"""
+import gc
+import weakref
+
+import pytest
+
+from music_indexer.search import string_matcher
+from music_indexer.search.auto_search import EnhancedStringMatcher
+from music_indexer.search.optimized_matcher import OptimizedMatcher
+from music_indexer.search.string_matcher import StringMatcher, trim_clean_caches
+
+
+@pytest.fixture(params=[StringMatcher, EnhancedStringMatcher])
+def matcher(request):
+    return request.param(threshold=75)
+
+
+def test_meaningful_words_are_a_tuple(matcher):
+    words = matcher.extract_meaningful_words(matcher.clean_string("Deadmau5 - Strobe (Extended Mix)"))
+
+    assert isinstance(words, tuple)
+    assert "strobe" in words
+    assert matcher.extract_meaningful_words("") == ()
+
+
+def test_meaningful_words_are_shared_from_the_cache(matcher):
+    text = "Avicii - Levels (Original Mix)"
+
+    first = matcher.extract_meaningful_words(text)
+    assert matcher.extract_meaningful_words(text) is first
+
+    # The cached result can't be changed in place by a caller
+    with pytest.raises(AttributeError):
+        first.append("extra")
+    assert first + ("extra",) != first
+    assert matcher.extract_meaningful_words(text) == first
+
+
+def test_scoring_accepts_word_tuples(matcher):
+    assert matcher.match_strings("Avicii Levels", "avicii - levels") >= matcher.threshold
+    assert matcher.match_against_filename("Avicii - Levels", "01-avicii_-_levels.mp3") >= matcher.threshold
+    assert matcher.match_strings("Avicii Levels", "Strobe") < matcher.threshold
+
+
+def test_trim_keeps_caches_that_fit_the_library():
+    StringMatcher().clean_string("Artist - Title.mp3")
+    size = string_matcher._clean_string.cache_info().currsize
+
+    trim_clean_caches(size)
+    assert string_matcher._clean_string.cache_info().currsize == size
+
+
+def test_trim_empties_caches_larger_than_the_library(monkeypatch):
+    monkeypatch.setattr(string_matcher, 'CLEAN_CACHE_SLACK', 0)
+    matcher = StringMatcher()
+    for i in range(10):
+        matcher.clean_string(f"Artist {i} - Title {i}")
+
+    trim_clean_caches(1)
+    assert string_matcher._clean_string.cache_info().currsize == 0
+    assert matcher.clean_string("Artist 1 - Title 1") == "artist 1 title 1"
+
+
+@pytest.mark.parametrize("make_matcher", [
+    lambda: StringMatcher(),
+    lambda: EnhancedStringMatcher(),
+    lambda: OptimizedMatcher(cache_manager=None),
+])
+def test_matchers_are_freed_without_the_garbage_collector(make_matcher):
+    gc.disable()
+    try:
+        matcher = make_matcher()
+        if isinstance(matcher, OptimizedMatcher):
+            matcher.clean_text_for_matching("Artist - Title-nrg")
+        else:
+            matcher.extract_meaningful_words("Artist - Title")
+        ref = weakref.ref(matcher)
+        del matcher
+        assert ref() is None
+    finally:
+        gc.enable()